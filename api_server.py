@@ -21,6 +21,7 @@ sys.path.insert(0, project_root)
 from bulk_analyzer import run_bulk_analysis
 from command_stats import analyze_command_statistics, generate_command_stats_report
 from command_stats.scanner import scan_command_steps_with_pagination
+from command_stats.reporter import convert_report_to_json_serializable
 from utils import logger
 
 app = Flask(__name__)
@@ -103,24 +104,9 @@ def analyze_command():
                 end_date=end_date
             )
             
-            # The report is already a dictionary, so we can return it directly
-            # Just add some additional formatting for the UI
-            result = report.copy()
-            
-            # Format percentages for better display (only if they're numbers)
-            if 'cache_hit' in result and 'percentage' in result['cache_hit']:
-                if isinstance(result['cache_hit']['percentage'], (int, float)):
-                    result['cache_hit']['percentage'] = f"{result['cache_hit']['percentage']:.2f}%"
-            
-            if 'cache_miss' in result and 'percentage' in result['cache_miss']:
-                if isinstance(result['cache_miss']['percentage'], (int, float)):
-                    result['cache_miss']['percentage'] = f"{result['cache_miss']['percentage']:.2f}%"
-                
-                # Format breakdown percentages
-                if 'breakdown' in result['cache_miss']:
-                    for category, breakdown in result['cache_miss']['breakdown'].items():
-                        if 'percentage' in breakdown and isinstance(breakdown['percentage'], (int, float)):
-                            breakdown['percentage'] = f"{breakdown['percentage']:.2f}%"
+            # Materialize the report (dataclass stats, float percentages)
+            # into the JSON shape the UI expects
+            result = convert_report_to_json_serializable(report)
             
             logger.info(f"Successfully analyzed command '{command}': {report['total_step_runs']} total runs")
             return jsonify(result)
@@ -8,7 +8,6 @@ This module implements the dual strategy:
 All from a single DynamoDB scan with incremental count and stats updates.
 """
 
-import json
 import os
 import re
 from datetime import datetime
@@ -16,6 +15,8 @@ from collections import defaultdict
 from typing import Dict, List, Optional, Any, Iterator
 from pathlib import Path
 
+import orjson
+
 from dynamodb_scanner import scan_test_steps_with_pagination
 from utils import convert_dynamodb_item_to_dict, logger
 from config import DEFAULT_OUTPUT_DIR
@@ -66,7 +67,7 @@ class BulkCommandAggregator:
             'unclassified': 0
         }
     
-    def update_command_stats(self, step_data: Dict, step_dynamodb: Dict):
+    def update_command_stats(self, step_data: Dict):
         """
         Update individual command statistics with incremental updates.
         
@@ -74,8 +75,7 @@ class BulkCommandAggregator:
         If command is new: initialize with count=1 and all stats
         
         Args:
-            step_data: Converted dictionary format (for easier access)
-            step_dynamodb: Original DynamoDB format (for classification)
+            step_data: Converted dictionary format (also used for classification)
         """
         command = step_data.get('command', 'UNKNOWN_COMMAND')
         app_package = step_data.get('app_package', 'UNKNOWN_PACKAGE')
@@ -92,7 +92,7 @@ class BulkCommandAggregator:
         miss_category = None
         if cache_status in [0, -1, None]:  # Cache miss or no cache attempt
             try:
-                miss_category = analyze_cache_miss_reason(step_dynamodb)
+                miss_category = analyze_cache_miss_reason(step_data)
             except Exception as e:
                 logger.warning(f"Failed to classify cache miss: {e}")
                 miss_category = "unclassified"
@@ -147,7 +147,7 @@ class BulkCommandAggregator:
             if cache_latency:
                 stats['cache_latencies'].append(cache_latency)
     
-    def update_command_package_stats(self, step_data: Dict, step_dynamodb: Dict):
+    def update_command_package_stats(self, step_data: Dict):
         """
         Update command+package statistics with incremental updates.
         
@@ -155,8 +155,7 @@ class BulkCommandAggregator:
         If (command, package) is new: initialize with count=1 and all stats
         
         Args:
-            step_data: Converted dictionary format (for easier access)
-            step_dynamodb: Original DynamoDB format (for classification)
+            step_data: Converted dictionary format (also used for classification)
         """
         command = step_data.get('command', 'UNKNOWN_COMMAND')
         app_package = step_data.get('app_package', 'UNKNOWN_PACKAGE')
@@ -173,7 +172,7 @@ class BulkCommandAggregator:
         miss_category = None
         if cache_status in [0, -1, None]:  # Cache miss or no cache attempt
             try:
-                miss_category = analyze_cache_miss_reason(step_dynamodb)
+                miss_category = analyze_cache_miss_reason(step_data)
             except Exception as e:
                 logger.warning(f"Failed to classify cache miss: {e}")
                 miss_category = "unclassified"
@@ -308,8 +307,7 @@ class BulkCommandAggregator:
             filepath = os.path.join(self.output_dir, filename)
             
             # Save file with full command in the JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(command_report, f, indent=2, ensure_ascii=False)
+            Path(filepath).write_bytes(orjson.dumps(command_report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Generated individual command file: {filename}")
             
@@ -380,8 +378,7 @@ class BulkCommandAggregator:
             filepath = os.path.join(self.output_dir, filename)
             
             # Save file with full command and package in the JSON
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(command_package_report, f, indent=2, ensure_ascii=False)
+            Path(filepath).write_bytes(orjson.dumps(command_package_report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Generated command+package file: {filename}")
             
@@ -422,8 +419,7 @@ class BulkCommandAggregator:
         }
         
         summary_file = os.path.join(self.output_dir, "bulk_analysis_summary.json")
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
+        Path(summary_file).write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Bulk analysis summary saved to: {summary_file}")
         return summary
@@ -470,12 +466,12 @@ def run_bulk_analysis(
             step_data = convert_dynamodb_item_to_dict(item)
             
             # Update both aggregators with incremental updates
-            # Pass both converted dict (for easy access) and original DynamoDB format (for classification)
+            # The converted dict is used for both stats and classification
             if generate_individual:
-                aggregator.update_command_stats(step_data, item)
+                aggregator.update_command_stats(step_data)
             
             if generate_command_package:
-                aggregator.update_command_package_stats(step_data, item)
+                aggregator.update_command_package_stats(step_data)
             
             # Log progress periodically
             if aggregator.total_steps_processed % batch_size == 0:
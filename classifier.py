@@ -19,14 +19,14 @@ Priority Order (from highest to lowest):
 from typing import Dict, List, Optional, Tuple
 from models import CacheFailureCategory
 from config import SIMILARITY_THRESHOLD
-from utils import parse_json_string, get_nested_value, logger
+from utils import parse_json_string, logger
 
 
 # ============================================================================
 # MAIN CLASSIFICATION FUNCTION - PRIORITY BASED
 # ============================================================================
 
-def classify_step(step: Dict) -> Tuple[List[str], Optional[Dict]]:
+def classify_step(step_dict: Dict) -> Tuple[List[CacheFailureCategory], Optional[Dict]]:
     """
     Classify a step into EXACTLY ONE category using priority order.
     
@@ -34,55 +34,56 @@ def classify_step(step: Dict) -> Tuple[List[str], Optional[Dict]]:
     This ensures each step belongs to only one category.
     
     Args:
-        step: DynamoDB item (in DynamoDB JSON format)
+        step_dict: Converted step (regular Python dict, see
+            utils.convert_dynamodb_item_to_dict)
         
     Returns:
         Tuple of ([single category], diagnostic dict or None)
     """
     # Priority 1: Unblocker Call (HIGHEST)
-    if check_undoable_category(step):
-        return [CacheFailureCategory.UNDOABLE.value], None
+    if check_undoable_category(step_dict):
+        return [CacheFailureCategory.UNDOABLE], None
 
-    if check_unblocker_category(step):
-        return [CacheFailureCategory.UNBLOCKER_CALL.value], None
+    if check_unblocker_category(step_dict):
+        return [CacheFailureCategory.UNBLOCKER_CALL], None
     
     # Priority 2: OCR Steps
-    if check_ocr_category(step):
-        return [CacheFailureCategory.OCR_STEPS.value], None
+    if check_ocr_category(step_dict):
+        return [CacheFailureCategory.OCR_STEPS], None
 
-    if check_dynamic_component(step):
-        return [CacheFailureCategory.DYNAMIC_STEP.value], None
+    if check_dynamic_component(step_dict):
+        return [CacheFailureCategory.DYNAMIC_STEP], None
     
     # Priority 3: Failed Step
-    if check_failed_step_category(step):
-        return [CacheFailureCategory.FAILED_STEP.value], None
+    if check_failed_step_category(step_dict):
+        return [CacheFailureCategory.FAILED_STEP], None
 
-    if check_null_llm_output(step):
-        return [CacheFailureCategory.NULL_LLM_OUTPUT.value], None
+    if check_null_llm_output(step_dict):
+        return [CacheFailureCategory.NULL_LLM_OUTPUT], None
     
     # Priority 4: Cache Read Status None
-    if check_cache_read_status_none(step):
-        return [CacheFailureCategory.CACHE_READ_STATUS_NONE.value], None
+    if check_cache_read_status_none(step_dict):
+        return [CacheFailureCategory.CACHE_READ_STATUS_NONE], None
     
     # Priority 5: No Cache Documents Found (cache_read_status = -1)
-    if check_no_documents_found_category(step):
-        return [CacheFailureCategory.NO_CACHE_DOCUMENTS_FOUND.value], None
+    if check_no_documents_found_category(step_dict):
+        return [CacheFailureCategory.NO_CACHE_DOCUMENTS_FOUND], None
     
     # Priority 6: Less Similarity Threshold
-    if check_less_similarity_category(step):
-        return [CacheFailureCategory.LESS_SIMILARITY_THRESHOLD.value], None
+    if check_less_similarity_category(step_dict):
+        return [CacheFailureCategory.LESS_SIMILARITY_THRESHOLD], None
     
     # Priority 7: Failed At Must Match Filter
-    if check_must_match_filter_category(step):
-        return [CacheFailureCategory.FAILED_AT_MUST_MATCH_FILTER.value], None
+    if check_must_match_filter_category(step_dict):
+        return [CacheFailureCategory.FAILED_AT_MUST_MATCH_FILTER], None
     
     # Priority 8: Failed After Similar Document
-    if check_failed_after_similar_doc_category(step):
-        return [CacheFailureCategory.FAILED_AFTER_SIMILAR_DOC.value], None
+    if check_failed_after_similar_doc_category(step_dict):
+        return [CacheFailureCategory.FAILED_AFTER_SIMILAR_DOC], None
     
     # Priority 9: Unclassified (LOWEST - should rarely happen)
-    diagnosis = diagnose_unclassified_step(step)
-    return [CacheFailureCategory.UNCLASSIFIED.value], diagnosis
+    diagnosis = diagnose_unclassified_step(step_dict)
+    return [CacheFailureCategory.UNCLASSIFIED], diagnosis
 
 
 # ============================================================================
@@ -93,33 +94,33 @@ def diagnose_unclassified_step(step: Dict) -> Dict[str, any]:
     """
     Deep diagnostic analysis for unclassified steps.
     """
-    step_id = get_nested_value(step, 'step_id', 'S', default='unknown')
+    step_id = step.get('step_id', 'unknown')
     
     diagnosis = {
         'step_id': step_id,
-        'step_classification': get_nested_value(step, 'step_classification', 'S'),
-        'cache_read_status': get_nested_value(step, 'cache_read_status', 'N'),
-        'test_step_status': get_nested_value(step, 'test_step_status', 'S'),
-        'has_cache_query_results': bool(get_nested_value(step, 'cache_query_results', 'S')),
-        'has_ocr_output': bool(get_nested_value(step, 'ocr_output', 'S') not in [None, 'NA', '']),
-        'is_blocker': get_nested_value(step, 'is_blocker', 'BOOL'),
+        'step_classification': step.get('step_classification'),
+        'cache_read_status': step.get('cache_read_status'),
+        'test_step_status': step.get('test_step_status'),
+        'has_cache_query_results': bool(step.get('cache_query_results')),
+        'has_ocr_output': bool(step.get('ocr_output') not in [None, 'NA', '']),
+        'is_blocker': step.get('is_blocker'),
         'category_checks': {}
     }
     
     # Check all categories
-    ocr_output = get_nested_value(step, 'ocr_output', 'S', default='NA')
+    ocr_output = step.get('ocr_output', 'NA')
     diagnosis['category_checks']['ocr_steps'] = {
         'passed': check_ocr_category(step),
         'reason': f"ocr_output={'present' if ocr_output not in ['NA', '', None] else 'absent'}"
     }
     
-    is_blocker = get_nested_value(step, 'is_blocker', 'BOOL')
+    is_blocker = step.get('is_blocker')
     diagnosis['category_checks']['unblocker_call'] = {
         'passed': check_unblocker_category(step),
         'reason': f"is_blocker={is_blocker}"
     }
     
-    test_step_status = get_nested_value(step, 'test_step_status', 'S')
+    test_step_status = step.get('test_step_status')
     diagnosis['category_checks']['failed_step'] = {
         'passed': check_failed_step_category(step),
         'reason': f"test_step_status={test_step_status}"
@@ -131,7 +132,7 @@ def diagnose_unclassified_step(step: Dict) -> Dict[str, any]:
         'reason': f"cache_read_status field {'missing' if not has_cache_read_status else 'present'}"
     }
     
-    cache_read_status = get_nested_value(step, 'cache_read_status', 'N')
+    cache_read_status = step.get('cache_read_status')
     diagnosis['category_checks']['no_cache_documents_found'] = {
         'passed': check_no_documents_found_category(step),
         'reason': f"cache_read_status={cache_read_status}"
@@ -148,7 +149,7 @@ def check_undoable_category(step: Dict) -> bool:
     """
     Priority 0: Check if step is undoable.
     """
-    llm_result = get_nested_value(step, 'llm_output', 'S')
+    llm_result = step.get('llm_output')
     
     return "undoable" in llm_result.lower() if llm_result else False
 
@@ -165,7 +166,7 @@ def check_unblocker_category(step: Dict) -> bool:
     #     is_blocker_str == 'TRUE' or 
     #     is_blocker_str == 'true'
     # )
-    llm_result = get_nested_value(step, 'llm_output', 'S')
+    llm_result = step.get('llm_output')
     return "unblock: " in llm_result.lower() if llm_result else False
 
 
@@ -173,7 +174,7 @@ def check_ocr_category(step: Dict) -> bool:
     """
     Priority 2: Check if OCR was used.
     """
-    ocr_output = get_nested_value(step, 'ocr_output', 'S', default='NA')
+    ocr_output = step.get('ocr_output', 'NA')
     
     return (
         ocr_output is not None and 
@@ -185,7 +186,7 @@ def check_dynamic_component(step: Dict) -> bool:
     """
     Priority 2.5: Check if the step used dynamic component resolution.
     """
-    is_ensemble = get_nested_value(step, 'ensemble_used', 'BOOL')
+    is_ensemble = step.get('ensemble_used')
     
     return is_ensemble is True
 
@@ -194,12 +195,12 @@ def check_failed_step_category(step: Dict) -> bool:
     """
     Priority 3: Check if the step execution failed.
     """
-    test_step_status = get_nested_value(step, 'test_step_status', 'S')
+    test_step_status = step.get('test_step_status')
     is_failed = test_step_status == 'FAILED'
     
     if is_failed:
         logger.debug(
-            f"Step {get_nested_value(step, 'step_id', 'S')}: "
+            f"Step {step.get('step_id')}: "
             f"test_step_status = FAILED"
         )
     
@@ -220,7 +221,7 @@ def check_null_llm_output(step: Dict) -> bool:
     """
     Priority 3.5: Check if the step execution failed.
     """
-    llm_output = get_nested_value(step, 'llm_output', 'S')
+    llm_output = step.get('llm_output')
     is_null_llm_output = llm_output == ''
     return is_null_llm_output
 
@@ -236,9 +237,9 @@ def check_no_documents_found_category(step: Dict) -> bool:
     - If cache_read_status = -1, the outcome is already clear
     - Whether no docs found OR low similarity, result is the same: cache didn't help
     """
-    cache_read_status = get_nested_value(step, 'cache_read_status', 'N')
+    cache_read_status = step.get('cache_read_status')
     
-    return cache_read_status == '-1'
+    return cache_read_status == -1
 
 
 def check_less_similarity_category(step: Dict) -> bool:
@@ -253,13 +254,13 @@ def check_less_similarity_category(step: Dict) -> bool:
     Note: Steps with cache_read_status = -1 are already caught
     by check_no_documents_found_category() at priority 5.
     """
-    cache_read_status = get_nested_value(step, 'cache_read_status', 'N')
+    cache_read_status = step.get('cache_read_status')
     
     # Skip steps with cache_read_status = -1 (already handled)
-    if cache_read_status == '-1':
+    if cache_read_status == -1:
         return False
     
-    cache_results_str = get_nested_value(step, 'cache_query_results', 'S')
+    cache_results_str = step.get('cache_query_results')
     
     if not cache_results_str:
         return False
@@ -276,7 +277,7 @@ def check_less_similarity_category(step: Dict) -> bool:
     
     if all_below_threshold:
         logger.debug(
-            f"Step {get_nested_value(step, 'step_id', 'S')}: "
+            f"Step {step.get('step_id')}: "
             f"All {len(cache_results)} documents have similarity < {SIMILARITY_THRESHOLD}"
         )
     
@@ -287,7 +288,7 @@ def check_must_match_filter_category(step: Dict) -> bool:
     """
     Priority 7: Check if step failed at must_match_filter stage.
     """
-    cache_results_str = get_nested_value(step, 'cache_query_results', 'S')
+    cache_results_str = step.get('cache_query_results')
     if not cache_results_str:
         return False
     
@@ -314,7 +315,7 @@ def check_failed_after_similar_doc_category(step: Dict) -> bool:
     """
     Priority 8: Check if step failed after finding similar document.
     """
-    cache_results_str = get_nested_value(step, 'cache_query_results', 'S')
+    cache_results_str = step.get('cache_query_results')
     if not cache_results_str:
         return False
     
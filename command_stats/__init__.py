@@ -7,6 +7,7 @@ cache behavior.
 
 Main Components:
 - scanner: DynamoDB querying with exact command matching
+- async_scanner: asyncio variant of the scanner (optional, requires aiobotocore)
 - analyzer: Statistics calculation using existing classifier logic  
 - reporter: JSON report generation and console output
 - cli: Command-line interface for easy usage
@@ -13,7 +13,7 @@ Key Features:
 - Calculates hit/miss statistics and percentages
 - Provides detailed breakdown of cache miss reasons
 - Handles latency calculations for cache hits
-- Maintains DynamoDB format compatibility
+- Classifies converted steps with the same checks as the bulk report
 """
 
 from typing import Dict, List, Optional, Tuple
@@ -35,13 +35,14 @@ from classifier import (
 )
 
 # REUSE existing utilities
-from utils import get_nested_value, parse_json_string, logger, convert_dynamodb_item_to_dict
+from utils import parse_json_string, logger, convert_dynamodb_item_to_dict
 from config import SIMILARITY_THRESHOLD
 
 from .models import (
     StepInfo, CacheMissBreakdown, CacheMissBreakdownCategory,
     CacheHitStats, CacheMissStats, CommandStatsReport,
-    create_empty_breakdown, calculate_percentage, create_step_info_from_dict
+    create_empty_breakdown, calculate_percentage, format_percentage,
+    create_step_info_from_dict
 )
 
 
@@ -84,12 +85,14 @@ def analyze_command_statistics(
     
     # Convert DynamoDB items to StepInfo objects
     step_infos = []
+    step_dicts = []
     for step_dynamodb in steps:
         try:
             # Convert DynamoDB format to regular dict
             step_dict = convert_dynamodb_item_to_dict(step_dynamodb)
             step_info = create_step_info_from_dict(step_dict)
             step_infos.append(step_info)
+            step_dicts.append(step_dict)
         except Exception as e:
             logger.warning(f"Failed to convert step: {e}")
             continue
@@ -103,7 +106,7 @@ def analyze_command_statistics(
     hit_stats = analyze_cache_hits(hit_steps)
     
     # Analyze cache misses with detailed breakdown
-    miss_stats = analyze_cache_misses(miss_steps, steps)  # Pass original DynamoDB format for classifier
+    miss_stats = analyze_cache_misses(miss_steps, step_dicts)  # Converted steps for classifier
     
     # Build final report
     report = build_command_stats_report(
@@ -116,7 +119,7 @@ def analyze_command_statistics(
         miss_stats=miss_stats
     )
     
-    logger.info(f"Analysis complete: {hit_stats['count']} hits, {miss_stats['count']} misses")
+    logger.info(f"Analysis complete: {hit_stats.count} hits, {miss_stats.count} misses")
     
     return report
 
@@ -186,38 +189,39 @@ def analyze_cache_hits(hit_steps: List[StepInfo]) -> CacheHitStats:
 # CACHE MISS ANALYSIS - REUSING EXISTING CLASSIFIER LOGIC
 # ============================================================================
 
-def analyze_cache_misses(miss_steps: List[StepInfo], original_dynamodb_steps: List[Dict]) -> CacheMissStats:
+def analyze_cache_misses(miss_steps: List[StepInfo], step_dicts: List[Dict]) -> CacheMissStats:
     """
     Analyze cache miss statistics with detailed breakdown.
     
     This function reuses the existing classifier logic to determine
-    the specific reasons for cache misses. We need to work with the
-    original DynamoDB format because the classifier functions expect that format.
+    the specific reasons for cache misses. The classifier functions take
+    converted steps (regular Python dicts), the same rows the StepInfo
+    objects were built from.
     
     Args:
         miss_steps: List of StepInfo objects that had cache misses
-        original_dynamodb_steps: Original DynamoDB items (for classifier functions)
+        step_dicts: Converted steps (for classifier functions)
         
     Returns:
         CacheMissStats with detailed miss breakdown
     """
-    # Create mapping from step_id to DynamoDB format for classifier functions
-    dynamodb_by_step_id = {get_nested_value(step, 'step_id', 'S'): step for step in original_dynamodb_steps}
+    # Create mapping from step_id to converted step for classifier functions
+    step_dict_by_step_id = {step_dict.get('step_id'): step_dict for step_dict in step_dicts}
     
     # Initialize breakdown categories
     breakdown = create_empty_breakdown()
     
     # Categorize each miss step
     for step_info in miss_steps:
-        # Get the original DynamoDB format for this step
-        dynamodb_step = dynamodb_by_step_id.get(step_info.step_id)
+        # Get the converted step for this step
+        step_dict = step_dict_by_step_id.get(step_info.step_id)
         
-        if not dynamodb_step:
-            logger.warning(f"Could not find DynamoDB format for step {step_info.step_id}")
+        if not step_dict:
+            logger.warning(f"Could not find step data for step {step_info.step_id}")
             continue
         
         # Determine miss reason using existing classifier logic
-        miss_reason = analyze_cache_miss_reason(dynamodb_step)
+        miss_reason = analyze_cache_miss_reason(step_dict)
         
         # Add to appropriate category
         add_step_to_breakdown_category(breakdown, miss_reason, step_info)
@@ -227,7 +231,7 @@ def analyze_cache_misses(miss_steps: List[StepInfo], original_dynamodb_steps: Li
     
     # Update percentages for each category
     for category_name, category_data in breakdown.items():
-        category_data['percentage'] = calculate_percentage(category_data['count'], total_misses)
+        category_data.percentage = calculate_percentage(category_data.count, total_misses)
     
     return CacheMissStats(
         count=total_misses,
@@ -236,63 +240,62 @@ def analyze_cache_misses(miss_steps: List[StepInfo], original_dynamodb_steps: Li
     )
 
 
-def analyze_cache_miss_reason(step_dynamodb_format: Dict) -> str:
+def analyze_cache_miss_reason(step_dict: Dict) -> str:
     """
     Determine specific cache miss reason using EXISTING classifier logic.
     
     This reuses your proven analysis functions in the SAME PRIORITY ORDER
-    as the existing classifier. The step must be in DynamoDB format because
-    the existing functions expect that format.
+    as the existing classifier, on the converted step dict.
     
     Args:
-        step_dynamodb_format: DynamoDB item in original format
+        step_dict: Converted step (regular Python dict)
         
     Returns:
         String indicating the miss reason category (matches existing classifier categories)
     """
     # Use existing classification logic in PRIORITY ORDER - no need to rewrite!
     # Priority 0: Undoable
-    if check_undoable_category(step_dynamodb_format):
+    if check_undoable_category(step_dict):
         return "undoable"
     
     # Priority 1: Unblocker Call
-    if check_unblocker_category(step_dynamodb_format):
+    if check_unblocker_category(step_dict):
         return "unblocker_call"
     
     # Priority 2: OCR Steps
-    if check_ocr_category(step_dynamodb_format):
+    if check_ocr_category(step_dict):
         return "ocr_steps"
     
     # Priority 2.5: Dynamic Component
-    if check_dynamic_component(step_dynamodb_format):
+    if check_dynamic_component(step_dict):
         return "dynamic_step"
     
     # Priority 3: Failed Step
-    if check_failed_step_category(step_dynamodb_format):
+    if check_failed_step_category(step_dict):
         return "failed_step"
     
     # Priority 3.5: Null LLM Output
-    if check_null_llm_output(step_dynamodb_format):
+    if check_null_llm_output(step_dict):
         return "null_llm_output"
     
     # Priority 4: Cache Read Status None
-    if check_cache_read_status_none(step_dynamodb_format):
+    if check_cache_read_status_none(step_dict):
         return "cache_read_status_none"
     
     # Priority 5: No Cache Documents Found
-    if check_no_documents_found_category(step_dynamodb_format):
+    if check_no_documents_found_category(step_dict):
         return "no_cache_documents_found"
     
     # Priority 6: Less Similarity Threshold
-    if check_less_similarity_category(step_dynamodb_format):
+    if check_less_similarity_category(step_dict):
         return "less_similarity_threshold"
     
     # Priority 7: Failed At Must Match Filter
-    if check_must_match_filter_category(step_dynamodb_format):
+    if check_must_match_filter_category(step_dict):
         return "failed_at_cand_nos_after_must_match_filter"
     
     # Priority 8: Failed After Similar Document
-    if check_failed_after_similar_doc_category(step_dynamodb_format):
+    if check_failed_after_similar_doc_category(step_dict):
         return "failed_after_similar_document_found_with_threshold_after_must_match_filter"
     
     # Priority 9: Unclassified (catch-all)
@@ -314,19 +317,19 @@ def add_step_to_breakdown_category(
     """
     # Direct mapping - miss_reason already matches breakdown category names
     # This ensures consistency with existing classifier categories
-    if miss_reason not in breakdown:
+    category = getattr(breakdown, miss_reason, None)
+    if category is None:
         logger.warning(f"Unknown miss reason: {miss_reason}, using 'unclassified'")
         miss_reason = "unclassified"
-    
-    category = breakdown[miss_reason]
+        category = breakdown.unclassified
     
     # Update category
-    category['count'] += 1
-    category['steps_list'].append(step_info)
+    category.count += 1
+    category.steps_list.append(step_info)
     
     # Set reason description if not already set
-    if not category['reason']:
-        category['reason'] = get_miss_reason_description(miss_reason)
+    if not category.reason:
+        category.reason = get_miss_reason_description(miss_reason)
 
 
 def get_miss_reason_description(miss_reason: str) -> str:
@@ -386,8 +389,8 @@ def build_command_stats_report(
         Complete CommandStatsReport
     """
     # Update percentages with correct totals
-    hit_stats['percentage'] = calculate_percentage(hit_stats['count'], total_steps)
-    miss_stats['percentage'] = calculate_percentage(miss_stats['count'], total_steps)
+    hit_stats.percentage = calculate_percentage(hit_stats.count, total_steps)
+    miss_stats.percentage = calculate_percentage(miss_stats.count, total_steps)
     
     # Build date range info
     date_range = {
@@ -425,14 +428,14 @@ def create_empty_report(
     """
     empty_hit_stats = CacheHitStats(
         count=0,
-        percentage="0.00%",
+        percentage=0.0,
         average_latency=0.0,
         steps_list=[]
     )
     
     empty_miss_stats = CacheMissStats(
         count=0,
-        percentage="0.00%",
+        percentage=0.0,
         breakdown=create_empty_breakdown()
     )
     
@@ -487,7 +490,7 @@ def get_analysis_summary(report: CommandStatsReport) -> Dict[str, str]:
         "command": report['command'],
         "app_package": report['app_package'],
         "total_steps": str(report['total_step_runs']),
-        "cache_hit_percentage": report['cache_hit']['percentage'],
-        "cache_miss_percentage": report['cache_miss']['percentage'],
-        "average_latency": f"{report['cache_hit']['average_latency']:.6f}s"
+        "cache_hit_percentage": format_percentage(report['cache_hit'].percentage),
+        "cache_miss_percentage": format_percentage(report['cache_miss'].percentage),
+        "average_latency": f"{report['cache_hit'].average_latency:.6f}s"
     }
@@ -0,0 +1,201 @@
+"""
+Async Command-Specific DynamoDB Scanner
+
+asyncio counterpart of scanner.scan_command_steps_with_pagination(),
+backed by aiobotocore. Every request shard (GSI partition Query or Scan
+segment) is paginated by its own coroutine on one event loop, so many
+shards can run concurrently without a thread per shard.
+
+Request building is shared with scanner.py, so both scanners issue
+exactly the same requests.
+
+Requires the optional aiobotocore dependency:
+    pip install aiobotocore
+
+Usage:
+    >>> async for item in scan_command_steps_async("Tap on Submit Button", "in.swiggy.android.instamart"):
+    ...     print(item['step_id'])
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+
+from config import (
+    AWS_ACCESS_KEY_ID,
+    AWS_SECRET_ACCESS_KEY,
+    AWS_REGION,
+    DYNAMODB_HOST,
+    SCAN_PAGE_LIMIT,
+    validate_aws_credentials
+)
+from utils import logger, convert_dynamodb_item_to_dict
+
+from .scanner import (
+    DEFAULT_TOTAL_SEGMENTS,
+    STEP_PROJECTION,
+    build_command_requests,
+    build_projection,
+    validate_command_inputs
+)
+
+
+# Sentinel posted by each shard coroutine when it has no more pages
+_SHARD_DONE = object()
+
+
+# ============================================================================
+# REQUEST SHARDS
+# ============================================================================
+
+def build_request_shards(
+    command: str,
+    app_package: str,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    total_segments: int,
+    projection: Optional[Tuple[str, ...]],
+    page_limit: Optional[int]
+) -> Tuple[str, List[Dict]]:
+    """
+    Build one request per concurrently paginated shard.
+    
+    Per-classification Queries are already separate requests; a single
+    Scan is split into total_segments segments.
+    
+    Returns:
+        Tuple of (operation name: 'query' or 'scan', list of request kwargs)
+    """
+    operation, request_kwargs_list = build_command_requests(command, app_package, start_date, end_date)
+    
+    for request_kwargs in request_kwargs_list:
+        if projection:
+            request_kwargs['ProjectionExpression'], request_kwargs['ExpressionAttributeNames'] = build_projection(projection)
+        if page_limit:
+            request_kwargs['Limit'] = page_limit
+    
+    if operation == 'scan' and total_segments > 1:
+        request_kwargs_list = [
+            dict(request_kwargs_list[0], Segment=segment, TotalSegments=total_segments)
+            for segment in range(total_segments)
+        ]
+    
+    return operation, request_kwargs_list
+
+
+# ============================================================================
+# ASYNC SCANNING
+# ============================================================================
+
+async def scan_command_steps_async(
+    command: str,
+    app_package: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+    projection: Optional[Tuple[str, ...]] = STEP_PROJECTION,
+    page_limit: Optional[int] = SCAN_PAGE_LIMIT
+) -> AsyncIterator[Dict]:
+    """
+    Async generator over the steps for a command and package.
+    
+    Same filtering and arguments as scan_command_steps_with_pagination()
+    (checkpoints and the RCU cap are only available there).
+    Item order across shards is not deterministic.
+    
+    Args:
+        command: Exact command string to match
+        app_package: App package to filter by
+        start_date: Optional start date in IST format
+        end_date: Optional end date in IST format
+        total_segments: Concurrent Scan segments for the fallback path
+        projection: Attributes to fetch (default: StepInfo fields, None = all attributes)
+        page_limit: Items evaluated per page (None/0 = 1MB pages)
+    
+    Yields:
+        Dict: Converted items (regular Python dicts)
+    
+    Raises:
+        ClientError: If DynamoDB operation fails
+        ValueError: If command or app_package is empty
+    """
+    validate_command_inputs(command, app_package)
+    validate_aws_credentials()
+    
+    operation, shards = build_request_shards(
+        command, app_package, start_date, end_date, total_segments, projection, page_limit
+    )
+    
+    client_config = {
+        'aws_access_key_id': AWS_ACCESS_KEY_ID,
+        'aws_secret_access_key': AWS_SECRET_ACCESS_KEY,
+        'region_name': AWS_REGION,
+        'config': AioConfig(
+            max_pool_connections=64,
+            retries={'mode': 'adaptive', 'max_attempts': 20}
+        )
+    }
+    
+    # Add host URL if using local DynamoDB
+    if DYNAMODB_HOST:
+        client_config['endpoint_url'] = DYNAMODB_HOST
+    
+    logger.info(f"Starting async command {operation} with {len(shards)} shard(s)")
+    
+    pages: asyncio.Queue = asyncio.Queue(maxsize=len(shards) * 2)
+    yielded_count = 0
+    
+    async with get_session().create_client('dynamodb', **client_config) as client:
+        fetch_page = getattr(client, operation)
+        
+        async def paginate_shard(request_kwargs: Dict) -> None:
+            try:
+                while True:
+                    response = await fetch_page(**request_kwargs)
+                    await pages.put(response)
+                    
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    request_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except Exception as e:
+                # CancelledError is not an Exception, so cancellation skips both puts
+                await pages.put(e)
+            await pages.put(_SHARD_DONE)
+        
+        tasks = [asyncio.create_task(paginate_shard(shard)) for shard in shards]
+        try:
+            finished_shards = 0
+            while finished_shards < len(tasks):
+                entry = await pages.get()
+                if entry is _SHARD_DONE:
+                    finished_shards += 1
+                elif isinstance(entry, Exception):
+                    raise entry
+                else:
+                    for item in entry.get('Items', []):
+                        yielded_count += 1
+                        yield convert_dynamodb_item_to_dict(item)
+        finally:
+            # Error or early close: stop the remaining shards
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    logger.info(f"Async command scan complete. Total items: {yielded_count}")
+
+
+def scan_command_steps_sync(*args, **kwargs) -> List[Dict]:
+    """
+    Run scan_command_steps_async() to completion from synchronous code.
+    
+    Takes the same arguments as scan_command_steps_async().
+    
+    Returns:
+        List of converted items
+    """
+    async def collect() -> List[Dict]:
+        return [item async for item in scan_command_steps_async(*args, **kwargs)]
+    
+    return asyncio.run(collect())
@@ -15,13 +15,14 @@ Key Features:
 import argparse
 import sys
 from datetime import datetime, date
+from pathlib import Path
 from typing import Optional, Dict, Any
 
 # Import our command_stats modules
 from .scanner import scan_command_steps_with_pagination, test_command_exists, validate_command_inputs
 from .analyzer import analyze_command_statistics, validate_analysis_inputs
-from .reporter import generate_command_stats_report, validate_report_consistency
-from .models import CommandStatsReport
+from .reporter import generate_command_stats_report
+from .models import CommandStatsReport, validate_report_data
 
 # Import existing utilities
 from utils import logger
@@ -57,6 +58,9 @@ Examples:
   
   # Console output only (no file save)
   python -m command_stats.cli --command "Tap on Submit Button" --package "in.swiggy.android.instamart" --no-save
+  
+  # Resumable long scan (rerun the same command after a failure to continue)
+  python -m command_stats.cli --command "Tap on Submit Button" --package "in.swiggy.android.instamart" --checkpoint-dir "./checkpoints"
 
 IMPORTANT: 
 - All dates are interpreted as IST (UTC+5:30)
@@ -115,6 +119,16 @@ IMPORTANT:
         help='Do not save report to file, only print summary to console'
     )
     
+    parser.add_argument(
+        '--checkpoint-dir',
+        type=Path,
+        default=None,
+        help='Directory for scan resume checkpoints (optional). A rerun with the same '
+             'arguments after a failed scan continues where it stopped; its totals then '
+             'cover only the remaining pages',
+        metavar='DIR'
+    )
+    
     # Debugging and development options
     parser.add_argument(
         '--verbose',
@@ -273,6 +287,9 @@ def main() -> int:
         if args.no_save:
             logger.info("File Save: Disabled (console output only)")
         
+        if args.checkpoint_dir:
+            logger.info(f"Checkpoint Directory: {args.checkpoint_dir}")
+        
         # Test command existence if requested
         if args.test_command or args.validate_only:
             logger.info("Testing command existence in database...")
@@ -301,7 +318,8 @@ def main() -> int:
                 command=args.command,
                 app_package=args.package,
                 start_date=args.start_date,
-                end_date=args.end_date
+                end_date=args.end_date,
+                checkpoint_dir=args.checkpoint_dir
             ))
             
             if not steps:
@@ -324,13 +342,9 @@ def main() -> int:
                 end_date=args.end_date
             )
             
-            # Step 3: Validate report consistency
-            logger.info("Step 3: Validating report consistency...")
-            if not validate_report_consistency(report):
-                logger.warning("Report validation failed, but continuing with generation")
-            
-            # Step 4: Generate and save report
-            logger.info("Step 4: Generating report...")
+            # Step 3: Validate and generate report
+            # (validation runs once inside generate_command_stats_report)
+            logger.info("Step 3: Generating report...")
             file_path = generate_command_stats_report(
                 report=report,
                 save_to_file=not args.no_save,
@@ -347,9 +361,9 @@ def main() -> int:
             logger.info("ANALYSIS COMPLETE")
             logger.info("="*80)
             logger.info(f"Total Steps Analyzed: {report['total_step_runs']}")
-            logger.info(f"Cache Hit Rate: {report['cache_hit']['percentage']}")
-            logger.info(f"Cache Miss Rate: {report['cache_miss']['percentage']}")
-            logger.info(f"Average Cache Latency: {report['cache_hit']['average_latency']:.6f}s")
+            logger.info(f"Cache Hit Rate: {report['cache_hit'].percentage:.2f}%")
+            logger.info(f"Cache Miss Rate: {report['cache_miss'].percentage:.2f}%")
+            logger.info(f"Average Cache Latency: {report['cache_hit'].average_latency:.6f}s")
             logger.info(f"Execution Time: {duration:.2f} seconds")
             
             if not args.no_save:
@@ -409,8 +423,9 @@ def run_quick_test(command: str, package: str) -> bool:
         report = analyze_command_statistics(limited_steps, command, package)
         
         # Validate report
-        if not validate_report_consistency(report):
-            logger.error("Report validation failed")
+        validation = validate_report_data(report)
+        if not validation.ok:
+            logger.error(f"Report validation failed: {validation.reason}")
             return False
         
         logger.info("✅ Quick test passed")
@@ -13,8 +13,8 @@ Key Design Principles:
 """
 
 from enum import Enum
-from typing import TypedDict, List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import TypedDict, List, Optional, Dict, Any, Iterator, Tuple
+from dataclasses import dataclass, field
 
 # Import existing models to reuse patterns and maintain consistency
 from models import CacheQueryResult, ComponentSelectionReport
@@ -82,24 +82,41 @@ class StepInfo:
     ensemble_used: Optional[bool]  # Whether ensemble was used
 
 
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating a CommandStatsReport.
+    
+    Carries the reason for a failed validation so callers can log
+    a single, descriptive message instead of a generic warning.
+    """
+    ok: bool                      # True if the report is consistent
+    reason: Optional[str] = None  # Description of the first inconsistency found
+
+
 # ============================================================================
 # STATISTICS STRUCTURES - Command-Specific Analysis
 # ============================================================================
 
-class CacheHitStats(TypedDict):
+@dataclass(slots=True)
+class CacheHitStats:
     """
     Statistics for cache hits (when cache_read_status = 1).
     
     This tells us how well cache performed when it worked successfully.
     Includes count, percentage, average latency, and list of all steps that hit cache.
+    
+    Uses a slotted dataclass (not a TypedDict) so the counters updated
+    during analysis are plain attribute reads/writes instead of dict lookups.
     """
-    count: int                    # Number of successful cache hits
-    percentage: str               # Percentage as string (e.g., "80.00%")
-    average_latency: float        # Average time for cache lookups in seconds
-    steps_list: List[StepInfo]    # List of all the steps that hit cache
+    count: int = 0                # Number of successful cache hits
+    percentage: float = 0.0       # Percentage as float (e.g., 80.0), formatted on output
+    average_latency: float = 0.0  # Average time for cache lookups in seconds
+    steps_list: List[StepInfo] = field(default_factory=list)  # List of all the steps that hit cache
 
 
-class CacheMissBreakdownCategory(TypedDict):
+@dataclass(slots=True)
+class CacheMissBreakdownCategory:
     """
     Detailed breakdown for one type of cache miss.
     
@@ -107,13 +124,14 @@ class CacheMissBreakdownCategory(TypedDict):
     Each category represents a different failure reason with its own
     count, percentage, explanation, and list of affected steps.
     """
-    count: int                    # Number of steps with this type of miss
-    percentage: str               # Percentage as string (e.g., "6.67%")
-    reason: str                   # Human-readable explanation of why cache failed
-    steps_list: List[StepInfo]    # List of steps with this miss type
+    count: int = 0                # Number of steps with this type of miss
+    percentage: float = 0.0       # Percentage as float (e.g., 6.67), formatted on output
+    reason: str = ""              # Human-readable explanation of why cache failed
+    steps_list: List[StepInfo] = field(default_factory=list)  # List of steps with this miss type
 
 
-class CacheMissBreakdown(TypedDict):
+@dataclass(slots=True)
+class CacheMissBreakdown:
     """
     Detailed breakdown of all cache miss types using existing classifier categories.
     
@@ -133,31 +151,40 @@ class CacheMissBreakdown(TypedDict):
     - failed_at_cand_nos_after_must_match_filter: Component selection failed at must_match_filter
     - failed_after_similar_document_found_with_threshold_after_must_match_filter: Failed after finding similar doc
     - unclassified: Catch-all for unclassified cases
+    
+    Field names match the category strings, so a category can be looked up
+    with getattr(breakdown, category_name).
     """
-    undoable: CacheMissBreakdownCategory
-    unblocker_call: CacheMissBreakdownCategory
-    ocr_steps: CacheMissBreakdownCategory
-    dynamic_step: CacheMissBreakdownCategory
-    null_llm_output: CacheMissBreakdownCategory
-    failed_step: CacheMissBreakdownCategory
-    cache_read_status_none: CacheMissBreakdownCategory
-    no_cache_documents_found: CacheMissBreakdownCategory
-    less_similarity_threshold: CacheMissBreakdownCategory
-    failed_at_cand_nos_after_must_match_filter: CacheMissBreakdownCategory
-    failed_after_similar_document_found_with_threshold_after_must_match_filter: CacheMissBreakdownCategory
-    unclassified: CacheMissBreakdownCategory
-
-
-class CacheMissStats(TypedDict):
+    undoable: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    unblocker_call: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    ocr_steps: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    dynamic_step: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    null_llm_output: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    failed_step: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    cache_read_status_none: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    no_cache_documents_found: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    less_similarity_threshold: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    failed_at_cand_nos_after_must_match_filter: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    failed_after_similar_document_found_with_threshold_after_must_match_filter: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    unclassified: CacheMissBreakdownCategory = field(default_factory=CacheMissBreakdownCategory)
+    
+    def items(self) -> Iterator[Tuple[str, CacheMissBreakdownCategory]]:
+        """Iterate over (category_name, category) pairs in priority order."""
+        for category_name in self.__slots__:
+            yield category_name, getattr(self, category_name)
+
+
+@dataclass(slots=True)
+class CacheMissStats:
     """
     Overall statistics for cache misses.
     
     This gives us the big picture of cache failures, including
     total count, percentage, and detailed breakdown by failure reason.
     """
-    count: int                    # Total number of cache misses
-    percentage: str               # Total percentage of misses
-    breakdown: CacheMissBreakdown # Detailed breakdown by failure reason
+    count: int = 0                # Total number of cache misses
+    percentage: float = 0.0       # Total percentage of misses
+    breakdown: CacheMissBreakdown = field(default_factory=CacheMissBreakdown)  # Detailed breakdown by failure reason
 
 
 class CommandStatsReport(TypedDict):
@@ -203,12 +230,7 @@ def create_empty_breakdown_category() -> CacheMissBreakdownCategory:
     Returns:
         CacheMissBreakdownCategory with all fields initialized to empty/zero values
     """
-    return CacheMissBreakdownCategory(
-        count=0,
-        percentage="0.00%",
-        reason="",
-        steps_list=[]
-    )
+    return CacheMissBreakdownCategory()
 
 
 def create_empty_breakdown() -> CacheMissBreakdown:
@@ -222,46 +244,48 @@ def create_empty_breakdown() -> CacheMissBreakdown:
     Returns:
         CacheMissBreakdown with all categories initialized to empty state
     """
-    return CacheMissBreakdown(
-        undoable=create_empty_breakdown_category(),
-        unblocker_call=create_empty_breakdown_category(),
-        ocr_steps=create_empty_breakdown_category(),
-        dynamic_step=create_empty_breakdown_category(),
-        null_llm_output=create_empty_breakdown_category(),
-        failed_step=create_empty_breakdown_category(),
-        cache_read_status_none=create_empty_breakdown_category(),
-        no_cache_documents_found=create_empty_breakdown_category(),
-        less_similarity_threshold=create_empty_breakdown_category(),
-        failed_at_cand_nos_after_must_match_filter=create_empty_breakdown_category(),
-        failed_after_similar_document_found_with_threshold_after_must_match_filter=create_empty_breakdown_category(),
-        unclassified=create_empty_breakdown_category()
-    )
+    return CacheMissBreakdown()
 
 
-def calculate_percentage(count: int, total: int) -> str:
+def calculate_percentage(count: int, total: int) -> float:
     """
-    Calculate percentage as a formatted string.
+    Calculate percentage as a float.
     
-    This follows the existing codebase pattern of formatting percentages
-    as strings with exactly 2 decimal places (e.g., "80.00%").
+    Percentages are kept numeric throughout the analysis and only
+    formatted (see format_percentage) when written to JSON or console.
     
     Args:
         count: Number of items in this category
         total: Total number of items
         
     Returns:
-        Formatted percentage string (e.g., "80.00%")
+        Percentage value (e.g., 80.0)
         
     Example:
         >>> calculate_percentage(120, 150)
-        "80.00%"
+        80.0
         >>> calculate_percentage(0, 100)
-        "0.00%"
+        0.0
     """
     if total == 0:
-        return "0.00%"
+        return 0.0
+    
+    return count * 100.0 / total
+
+
+def format_percentage(percentage: float) -> str:
+    """
+    Format a percentage value as a string with 2 decimal places.
     
-    percentage = (count / total) * 100
+    This follows the existing codebase pattern of presenting percentages
+    as strings (e.g., "80.00%") in reports and console output.
+    
+    Args:
+        percentage: Percentage value (e.g., 80.0)
+        
+    Returns:
+        Formatted percentage string (e.g., "80.00%")
+    """
     return f"{percentage:.2f}%"
 
 
@@ -341,34 +365,60 @@ def validate_step_info(step_info: StepInfo) -> bool:
     return True
 
 
-def validate_report_data(report: CommandStatsReport) -> bool:
+def validate_report_data(report: CommandStatsReport) -> ValidationResult:
     """
     Validate that a CommandStatsReport has consistent data.
     
-    This ensures that percentages add up correctly and counts are consistent.
+    This is the single validation pass for a report. It ensures that
+    counts are consistent and that percentages add up correctly.
     
     Args:
         report: CommandStatsReport to validate
         
     Returns:
-        True if valid, False otherwise
+        ValidationResult with ok=True if valid, otherwise ok=False and
+        a reason describing the first inconsistency found
     """
-    total = report['total_step_runs']
-    hit_count = report['cache_hit']['count']
-    miss_count = report['cache_miss']['count']
-    
-    # Check that hit + miss = total
-    if hit_count + miss_count != total:
-        return False
-    
-    # Check that breakdown counts add up to miss count
-    breakdown = report['cache_miss']['breakdown']
-    breakdown_total = sum(
-        category['count'] 
-        for category in breakdown.values()
-    )
-    
-    if breakdown_total != miss_count:
-        return False
-    
-    return True
\ No newline at end of file
+    try:
+        total = report['total_step_runs']
+        hit_count = report['cache_hit'].count
+        miss_count = report['cache_miss'].count
+        
+        # Check that hit + miss = total
+        if hit_count + miss_count != total:
+            return ValidationResult(
+                ok=False,
+                reason=f"Hit count ({hit_count}) + Miss count ({miss_count}) != Total ({total})"
+            )
+        
+        # Check that breakdown counts add up to miss count
+        breakdown = report['cache_miss'].breakdown
+        breakdown_total = sum(
+            category.count 
+            for _, category in breakdown.items()
+        )
+        
+        if breakdown_total != miss_count:
+            return ValidationResult(
+                ok=False,
+                reason=f"Breakdown total ({breakdown_total}) != Miss count ({miss_count})"
+            )
+        
+        # Check that percentages are reasonable (only meaningful with data)
+        if total > 0:
+            hit_percentage = report['cache_hit'].percentage
+            miss_percentage = report['cache_miss'].percentage
+            
+            if abs(hit_percentage + miss_percentage - 100.0) > 0.01:  # Allow small floating point errors
+                return ValidationResult(
+                    ok=False,
+                    reason=(
+                        f"Hit percentage ({hit_percentage:.2f}%) + "
+                        f"Miss percentage ({miss_percentage:.2f}%) != 100%"
+                    )
+                )
+    
+    except (KeyError, AttributeError, TypeError) as e:
+        return ValidationResult(ok=False, reason=f"Malformed report: {e}")
+    
+    return ValidationResult(ok=True)
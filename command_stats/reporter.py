@@ -13,15 +13,20 @@ Key Features:
 - Follows existing report generation patterns
 """
 
-import json
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
 
+import orjson
+
 from utils import logger
 from config import DEFAULT_OUTPUT_DIR
 
-from .models import CommandStatsReport, validate_report_data
+from .models import CommandStatsReport, validate_report_data, format_percentage
 
 
 # ============================================================================
@@ -32,7 +37,8 @@ def generate_command_stats_report(
     report: CommandStatsReport,
     save_to_file: bool = True,
     output_path: Optional[str] = None,
-    print_to_console: bool = True
+    print_to_console: bool = True,
+    output_dir: Optional[Path] = None
 ) -> str:
     """
     Generate and save command statistics report.
@@ -45,6 +51,7 @@ def generate_command_stats_report(
         save_to_file: Whether to save report to JSON file
         output_path: Custom output file path (optional)
         print_to_console: Whether to print summary to console
+        output_dir: Directory for auto-generated filenames (defaults to DEFAULT_OUTPUT_DIR)
         
     Returns:
         Path to saved file (if saved) or "console_only"
@@ -54,9 +61,9 @@ def generate_command_stats_report(
         >>> file_path = generate_command_stats_report(report)
         >>> print(f"Report saved to: {file_path}")
     """
-    # Validate report data
-    if not validate_report_data(report):
-        logger.warning("Report data validation failed, but continuing with generation")
+    # Validate report data (stripped entirely under python -O)
+    if __debug__:
+        _warn_if_invalid(report)
     
     # Print to console if requested
     if print_to_console:
@@ -64,16 +71,27 @@ def generate_command_stats_report(
     
     # Save to file if requested
     if save_to_file:
-        file_path = save_report_to_file(report, output_path)
+        file_path = save_report_to_file(report, output_path, output_dir)
         logger.info(f"Command stats report saved to: {file_path}")
         return file_path
     
     return "console_only"
 
 
+def _warn_if_invalid(report: CommandStatsReport) -> None:
+    """Validate a report once and log the reason if it is inconsistent."""
+    validation = validate_report_data(report)
+    if not validation.ok:
+        logger.warning(
+            f"Report validation failed for command '{report['command']}': "
+            f"{validation.reason}. Continuing with generation"
+        )
+
+
 def save_report_to_file(
     report: CommandStatsReport,
-    output_path: Optional[str] = None
+    output_path: Optional[str] = None,
+    output_dir: Optional[Path] = None
 ) -> str:
     """
     Save command statistics report to JSON file.
@@ -84,12 +102,13 @@ def save_report_to_file(
     Args:
         report: CommandStatsReport to save
         output_path: Custom output file path (optional)
+        output_dir: Directory for auto-generated filenames (defaults to DEFAULT_OUTPUT_DIR)
         
     Returns:
         Path to the saved file
     """
     # Create output directory
-    output_dir = Path(DEFAULT_OUTPUT_DIR)
+    output_dir = Path(output_dir or DEFAULT_OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate filename if not provided
@@ -108,8 +127,8 @@ def save_report_to_file(
     
     # Save to file
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(json_report, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes in one call (no 8 KiB buffered writes)
+        Path(output_path).write_bytes(orjson.dumps(json_report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"Report written to: {output_path}")
         return output_path
@@ -123,8 +142,12 @@ def convert_report_to_json_serializable(report: CommandStatsReport) -> Dict:
     """
     Convert CommandStatsReport to JSON-serializable format.
     
-    This handles any non-JSON-serializable objects in the report,
-    such as StepInfo dataclass objects.
+    The hit/miss statistics are slotted dataclasses (with StepInfo
+    dataclasses inside), so they are materialized into plain dicts here,
+    at the JSON boundary, and the numeric percentages are formatted as
+    strings (e.g., "80.00%") for the output file.
+    
+    The in-memory report is left untouched.
     
     Args:
         report: CommandStatsReport to convert
@@ -132,23 +155,19 @@ def convert_report_to_json_serializable(report: CommandStatsReport) -> Dict:
     Returns:
         JSON-serializable dictionary
     """
-    # Convert StepInfo objects to dictionaries
     json_report = dict(report)
     
-    # Convert hit steps
-    if 'cache_hit' in json_report and 'steps_list' in json_report['cache_hit']:
-        json_report['cache_hit']['steps_list'] = [
-            step_info.__dict__ for step_info in json_report['cache_hit']['steps_list']
-        ]
+    # Convert hit stats
+    hit_stats = asdict(report['cache_hit'])
+    hit_stats['percentage'] = format_percentage(hit_stats['percentage'])
+    json_report['cache_hit'] = hit_stats
     
-    # Convert miss breakdown steps
-    if 'cache_miss' in json_report and 'breakdown' in json_report['cache_miss']:
-        breakdown = json_report['cache_miss']['breakdown']
-        for category_name, category_data in breakdown.items():
-            if 'steps_list' in category_data:
-                category_data['steps_list'] = [
-                    step_info.__dict__ for step_info in category_data['steps_list']
-                ]
+    # Convert miss stats and breakdown
+    miss_stats = asdict(report['cache_miss'])
+    miss_stats['percentage'] = format_percentage(miss_stats['percentage'])
+    for category_data in miss_stats['breakdown'].values():
+        category_data['percentage'] = format_percentage(category_data['percentage'])
+    json_report['cache_miss'] = miss_stats
     
     return json_report
 
@@ -164,46 +183,58 @@ def print_command_stats_summary(report: CommandStatsReport) -> None:
     This provides a quick overview of the analysis results,
     following the same format as the existing report_generator.py.
     
+    The summary is built in memory and written to stdout in a single
+    call. Decorative separator lines are only emitted when stdout is a
+    terminal, so redirected/CI output stays compact.
+    
     Args:
         report: CommandStatsReport to summarize
     """
-    print("\n" + "="*80)
-    print("COMMAND-LEVEL CACHE STATISTICS REPORT")
-    print("="*80)
+    buf = io.StringIO()
+    w = buf.write
+    
+    decorate = sys.stdout.isatty()
+    rule = "="*80 + "\n" if decorate else ""
+    thin_rule = "-"*80 + "\n" if decorate else ""
+    
+    w("\n" + rule)
+    w("COMMAND-LEVEL CACHE STATISTICS REPORT\n")
+    w(rule)
     
     # Basic information
-    print(f"Command: {report['command']}")
-    print(f"App Package: {report['app_package']}")
-    print(f"Date Range: {report['date_range']['start']} to {report['date_range']['end']}")
-    print(f"Total Step Runs: {report['total_step_runs']}")
+    w(f"Command: {report['command']}\n")
+    w(f"App Package: {report['app_package']}\n")
+    w(f"Date Range: {report['date_range']['start']} to {report['date_range']['end']}\n")
+    w(f"Total Step Runs: {report['total_step_runs']}\n")
     
     if report['total_step_runs'] == 0:
-        print("\n⚠️  No steps found for this command and package combination.")
-        print("="*80)
+        w("\n⚠️  No steps found for this command and package combination.\n")
+        w(rule)
+        sys.stdout.write(buf.getvalue())
         return
     
-    print("\nCache Performance Summary:")
-    print("-"*80)
+    w("\nCache Performance Summary:\n")
+    w(thin_rule)
     
     # Cache hits
     hit_stats = report['cache_hit']
-    print(f"Cache Hits:")
-    print(f"  Count: {hit_stats['count']:>6}")
-    print(f"  Percentage: {hit_stats['percentage']:>8}")
-    print(f"  Average Latency: {hit_stats['average_latency']:.6f}s")
+    w("Cache Hits:\n")
+    w(f"  Count: {hit_stats.count:>6}\n")
+    w(f"  Percentage: {format_percentage(hit_stats.percentage):>8}\n")
+    w(f"  Average Latency: {hit_stats.average_latency:.6f}s\n")
     
     # Cache misses
     miss_stats = report['cache_miss']
-    print(f"\nCache Misses:")
-    print(f"  Count: {miss_stats['count']:>6}")
-    print(f"  Percentage: {miss_stats['percentage']:>8}")
+    w("\nCache Misses:\n")
+    w(f"  Count: {miss_stats.count:>6}\n")
+    w(f"  Percentage: {format_percentage(miss_stats.percentage):>8}\n")
     
     # Detailed miss breakdown
-    if miss_stats['count'] > 0:
-        print(f"\nCache Miss Breakdown (Detailed):")
-        print("-"*80)
+    if miss_stats.count > 0:
+        w("\nCache Miss Breakdown (Detailed):\n")
+        w(thin_rule)
         
-        breakdown = miss_stats['breakdown']
+        breakdown = miss_stats.breakdown
         
         # Print categories in priority order (matching existing classifier)
         priority_order = [
@@ -221,76 +252,32 @@ def print_command_stats_summary(report: CommandStatsReport) -> None:
             "unclassified"
         ]
         
-        for category_name in priority_order:
-            if category_name in breakdown:
-                category_data = breakdown[category_name]
-                if category_data['count'] > 0:
-                    display_name = category_name.replace('_', ' ').title()
-                    print(f"{display_name}:")
-                    print(f"  Count: {category_data['count']:>6}")
-                    print(f"  Percentage: {category_data['percentage']:>8}")
-                    print(f"  Reason: {category_data['reason']}")
-                    print()
-    
-    print("="*80)
-    print("Note: Percentages are calculated from total step runs")
-    print("="*80)
+        categories = [
+            (category_name, getattr(breakdown, category_name))
+            for category_name in priority_order
+        ]
+        
+        w("\n".join(
+            f"{category_name.replace('_', ' ').title()}:\n"
+            f"  Count: {category_data.count:>6}\n"
+            f"  Percentage: {format_percentage(category_data.percentage):>8}\n"
+            f"  Reason: {category_data.reason}\n"
+            for category_name, category_data in categories
+            if category_data.count > 0
+        ))
+        w("\n")
+    
+    w(rule)
+    w("Note: Percentages are calculated from total step runs\n")
+    w(rule)
+    
+    sys.stdout.write(buf.getvalue())
 
 
 # ============================================================================
-# REPORT VALIDATION AND UTILITIES
+# REPORT UTILITIES
 # ============================================================================
 
-def validate_report_consistency(report: CommandStatsReport) -> bool:
-    """
-    Validate that the report data is consistent and makes sense.
-    
-    This performs additional validation beyond the basic data structure
-    validation to ensure the report is logically consistent.
-    
-    Args:
-        report: CommandStatsReport to validate
-        
-    Returns:
-        True if report is consistent, False otherwise
-    """
-    try:
-        total = report['total_step_runs']
-        hit_count = report['cache_hit']['count']
-        miss_count = report['cache_miss']['count']
-        
-        # Check that hit + miss = total
-        if hit_count + miss_count != total:
-            logger.error(f"Hit count ({hit_count}) + Miss count ({miss_count}) != Total ({total})")
-            return False
-        
-        # Check that breakdown counts add up to miss count
-        breakdown = report['cache_miss']['breakdown']
-        breakdown_total = sum(
-            category['count'] 
-            for category in breakdown.values()
-        )
-        
-        if breakdown_total != miss_count:
-            logger.error(f"Breakdown total ({breakdown_total}) != Miss count ({miss_count})")
-            return False
-        
-        # Check that percentages are reasonable
-        hit_percentage = float(report['cache_hit']['percentage'].rstrip('%'))
-        miss_percentage = float(report['cache_miss']['percentage'].rstrip('%'))
-        
-        if abs(hit_percentage + miss_percentage - 100.0) > 0.01:  # Allow small floating point errors
-            logger.error(f"Hit percentage ({hit_percentage}%) + Miss percentage ({miss_percentage}%) != 100%")
-            return False
-        
-        logger.debug("Report validation passed")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Report validation failed: {e}")
-        return False
-
-
 def get_report_statistics(report: CommandStatsReport) -> Dict[str, any]:
     """
     Get key statistics from the report for quick analysis.
@@ -303,11 +290,11 @@ def get_report_statistics(report: CommandStatsReport) -> Dict[str, any]:
     """
     return {
         "total_steps": report['total_step_runs'],
-        "hit_count": report['cache_hit']['count'],
-        "miss_count": report['cache_miss']['count'],
-        "hit_percentage": report['cache_hit']['percentage'],
-        "miss_percentage": report['cache_miss']['percentage'],
-        "average_latency": report['cache_hit']['average_latency'],
+        "hit_count": report['cache_hit'].count,
+        "miss_count": report['cache_miss'].count,
+        "hit_percentage": report['cache_hit'].percentage,
+        "miss_percentage": report['cache_miss'].percentage,
+        "average_latency": report['cache_hit'].average_latency,
         "command": report['command'],
         "app_package": report['app_package']
     }
@@ -319,48 +306,111 @@ def get_report_statistics(report: CommandStatsReport) -> Dict[str, any]:
 
 def generate_multiple_command_reports(
     reports: list[CommandStatsReport],
-    output_dir: Optional[str] = None
+    output_dir: Optional[str] = None,
+    output_mode: str = 'files'
 ) -> list[str]:
     """
     Generate multiple command reports in batch.
     
     This is useful for analyzing multiple commands at once.
     
+    Output modes:
+    - 'files' (default): one JSON file per report, written in parallel.
+      The output directory is passed down explicitly so concurrent
+      writers never share mutable module state.
+    - 'jsonl': all reports written to a single JSON-Lines file
+      (one report per line), with a one-line summary per report
+      printed to the console.
+    
     Args:
         reports: List of CommandStatsReport objects
         output_dir: Custom output directory (optional)
+        output_mode: 'files' or 'jsonl'
         
     Returns:
-        List of file paths for generated reports
+        List of file paths for generated reports (same order as reports).
+        In 'jsonl' mode this is a single-element list with the .jsonl path.
+        
+    Raises:
+        ValueError: If output_mode is not recognised
     """
-    if output_dir:
-        global DEFAULT_OUTPUT_DIR
-        original_dir = DEFAULT_OUTPUT_DIR
-        DEFAULT_OUTPUT_DIR = output_dir
+    if output_mode not in ('files', 'jsonl'):
+        raise ValueError(f"Unknown output mode: {output_mode} (expected 'files' or 'jsonl')")
     
-    file_paths = []
+    if not reports:
+        return []
     
-    try:
-        for i, report in enumerate(reports):
-            logger.info(f"Generating report {i+1}/{len(reports)}: {report['command']}")
-            
-            file_path = generate_command_stats_report(
-                report=report,
-                save_to_file=True,
-                print_to_console=False  # Don't spam console with multiple reports
-            )
-            
-            file_paths.append(file_path)
-    
-    finally:
-        # Restore original output directory
-        if output_dir:
-            DEFAULT_OUTPUT_DIR = original_dir
+    if output_mode == 'jsonl':
+        return [save_reports_to_jsonl(reports, output_dir)]
+    
+    def generate_one(indexed_report) -> str:
+        i, report = indexed_report
+        logger.info(f"Generating report {i+1}/{len(reports)}: {report['command']}")
+        
+        return generate_command_stats_report(
+            report=report,
+            save_to_file=True,
+            print_to_console=False,  # Don't spam console with multiple reports
+            output_dir=output_dir
+        )
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(reports))) as executor:
+        file_paths = list(executor.map(generate_one, enumerate(reports)))
     
     logger.info(f"Generated {len(file_paths)} command statistics reports")
     return file_paths
 
 
+def save_reports_to_jsonl(
+    reports: list[CommandStatsReport],
+    output_dir: Optional[str] = None
+) -> str:
+    """
+    Save many command statistics reports to a single JSON-Lines file.
+    
+    Each report is serialized with orjson on its own line, so the whole
+    batch costs one open/close instead of one file per report.
+    
+    Args:
+        reports: List of CommandStatsReport objects
+        output_dir: Custom output directory (optional)
+        
+    Returns:
+        Path to the saved .jsonl file
+    """
+    output_dir = Path(output_dir or DEFAULT_OUTPUT_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_path = str(output_dir / f"command_stats_{timestamp}.jsonl")
+    
+    summary_lines = []
+    
+    try:
+        with open(output_path, 'wb') as f:
+            for report in reports:
+                if __debug__:
+                    _warn_if_invalid(report)
+                
+                f.write(orjson.dumps(convert_report_to_json_serializable(report), option=orjson.OPT_NON_STR_KEYS) + b"\n")
+                
+                summary_lines.append(
+                    f"{report['command']} | {report['app_package']} | "
+                    f"runs: {report['total_step_runs']} | "
+                    f"hit: {format_percentage(report['cache_hit'].percentage)} | "
+                    f"miss: {format_percentage(report['cache_miss'].percentage)}\n"
+                )
+    
+    except Exception as e:
+        logger.error(f"Failed to save reports to {output_path}: {e}")
+        raise
+    
+    sys.stdout.write("".join(summary_lines))
+    
+    logger.info(f"Wrote {len(reports)} command statistics reports to: {output_path}")
+    return output_path
+
+
 # ============================================================================
 # DEVELOPMENT AND DEBUGGING HELPERS
 # ============================================================================
@@ -386,19 +436,19 @@ def print_report_debug_info(report: CommandStatsReport) -> None:
     hit_stats = report['cache_hit']
     print(f"\nHit Stats:")
     print(f"  Type: {type(hit_stats)}")
-    print(f"  Keys: {list(hit_stats.keys())}")
-    print(f"  Steps List Length: {len(hit_stats['steps_list'])}")
+    print(f"  Fields: {list(hit_stats.__slots__)}")
+    print(f"  Steps List Length: {len(hit_stats.steps_list)}")
     
     # Miss stats debug
     miss_stats = report['cache_miss']
     print(f"\nMiss Stats:")
     print(f"  Type: {type(miss_stats)}")
-    print(f"  Keys: {list(miss_stats.keys())}")
+    print(f"  Fields: {list(miss_stats.__slots__)}")
     
-    breakdown = miss_stats['breakdown']
-    print(f"  Breakdown Categories: {list(breakdown.keys())}")
+    breakdown = miss_stats.breakdown
+    print(f"  Breakdown Categories: {list(breakdown.__slots__)}")
     
     for category_name, category_data in breakdown.items():
-        print(f"    {category_name}: {category_data['count']} steps")
+        print(f"    {category_name}: {category_data.count} steps")
     
     print("="*80)
\ No newline at end of file
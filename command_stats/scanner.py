@@ -12,33 +12,54 @@ Key Features:
 - Exact command matching (case-sensitive string equality)
 - App package filtering
 - Optional date range filtering
+- Query on the app_package/created_at GSI when configured
+  (DYNAMODB_COMMAND_INDEX_NAME), or one parallel Query per step
+  classification (DYNAMODB_CLASSIFICATION_INDEX_NAME), parallel
+  segmented Scan otherwise
 - Memory-efficient generator pattern
 - Comprehensive error handling
 """
 
+import functools
+import hashlib
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from pathlib import Path
+from typing import Iterator, Dict, Optional, List, Tuple, Callable
+
 import boto3
-from typing import Iterator, Dict, Optional, List
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Reuse existing configuration and utilities
-from config import (
-    AWS_ACCESS_KEY_ID, 
-    AWS_SECRET_ACCESS_KEY, 
-    AWS_REGION,
-    DYNAMODB_TABLE_NAME,
-    DYNAMODB_HOST,
-    STEP_CLASSIFICATIONS_FILTER
-)
+# Environment-driven settings are read as config.<NAME> where they are used,
+# so importing this module (and the command_stats package) does not load .env
+import config
+from config import STEP_CLASSIFICATIONS_FILTER, validate_aws_credentials
 from utils import logger, convert_dynamodb_item_to_dict
 
+from .models import StepInfo
+
 
 # ============================================================================
 # DYNAMODB CLIENT SETUP - Reusing Existing Pattern
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_client():
     """
-    Create and return boto3 DynamoDB client.
+    Create and return the shared boto3 DynamoDB client.
+    
+    The client is built once per process and reused, so repeated scans
+    skip botocore session/endpoint setup and keep HTTPS connections
+    alive. boto3 low-level clients are thread-safe, and the connection
+    pool is sized for parallel segment scans.
     
     This is identical to the existing dynamodb_scanner.py implementation.
     We reuse the same client setup to maintain consistency.
@@ -48,29 +69,622 @@ def get_dynamodb_client():
     
     Returns:
         boto3 DynamoDB client
+        
+    Raises:
+        ValueError: If AWS credentials are not configured
     """
+    validate_aws_credentials()
+    
     client_config = {
-        'aws_access_key_id': AWS_ACCESS_KEY_ID,
-        'aws_secret_access_key': AWS_SECRET_ACCESS_KEY,
-        'region_name': AWS_REGION
+        'aws_access_key_id': config.AWS_ACCESS_KEY_ID,
+        'aws_secret_access_key': config.AWS_SECRET_ACCESS_KEY,
+        'region_name': config.AWS_REGION,
+        'config': Config(
+            max_pool_connections=64,
+            retries={'mode': 'adaptive', 'max_attempts': 20},
+            tcp_keepalive=True
+        )
     }
     
     # Add host URL if using local DynamoDB
-    if DYNAMODB_HOST:
-        client_config['endpoint_url'] = DYNAMODB_HOST
+    if config.DYNAMODB_HOST:
+        client_config['endpoint_url'] = config.DYNAMODB_HOST
     
     return boto3.client('dynamodb', **client_config)
 
 
+# ============================================================================
+# REQUEST BUILDING - Query on GSI or Scan Fallback
+# ============================================================================
+
+# Static part of every request's ExpressionAttributeValues, built once
+_BASE_EXPR_VALUES: Dict[str, Dict[str, str]] = {
+    ':tap': {'S': 'TAP'},
+    ':text': {'S': 'TEXT'},
+}
+
+# Partition key values for the per-classification index Queries
+_CLASSIFICATION_VALUES: Dict[str, Dict[str, str]] = {
+    classification: {'S': classification}
+    for classification in STEP_CLASSIFICATIONS_FILTER
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_command_filter(
+    command: Optional[str],
+    app_package: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Tuple[str, Dict[str, Dict[str, str]]]:
+    """
+    Build the Scan FilterExpression and its attribute values.
+    
+    Memoized so repeated lookups for the same command reuse one
+    expression string and values dict. The returned dict is shared
+    between callers and must be treated as read-only.
+    
+    Args:
+        command: Exact command string to match (None = any command)
+        app_package: App package to filter by
+        start_date: Optional start date
+        end_date: Optional end date
+        
+    Returns:
+        Tuple of (FilterExpression, ExpressionAttributeValues)
+    """
+    # We use AND conditions to combine all our filters
+    filter_conditions = ['step_classification IN (:tap, :text)']  # Existing filter
+    
+    if command is not None:
+        filter_conditions.append('command = :command')  # Exact command match
+        expression_values = {
+            **_BASE_EXPR_VALUES,
+            ':command': {'S': command.strip()},  # Exact match, trimmed
+            ':app_package': {'S': app_package.strip()}  # Exact match, trimmed
+        }
+    else:
+        # Any command: drop rows without one server-side instead of
+        # transferring them (equality above already implies this)
+        filter_conditions.append('attribute_exists(command) AND size(command) > :zero')
+        expression_values = {
+            **_BASE_EXPR_VALUES,
+            ':zero': {'N': '0'},
+            ':app_package': {'S': app_package.strip()}  # Exact match, trimmed
+        }
+    
+    filter_conditions.append('app_package = :app_package')  # App package match
+    
+    # Add date range filter if provided
+    if start_date and end_date:
+        filter_conditions.append('created_at BETWEEN :start_date AND :end_date')
+        expression_values[':start_date'] = {'S': start_date}
+        expression_values[':end_date'] = {'S': end_date}
+    
+    return ' AND '.join(filter_conditions), expression_values
+
+
+def build_command_requests(
+    command: str,
+    app_package: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Tuple[str, List[Dict]]:
+    """
+    Build the DynamoDB request(s) for a command + package lookup.
+    
+    When DYNAMODB_COMMAND_INDEX_NAME is configured, we Query the GSI
+    (partition key app_package, sort key created_at). Only the matching
+    partition is read, so cost scales with the number of steps for the
+    package instead of the size of the table. The command and step
+    classification are applied as a FilterExpression (key attributes
+    cannot appear in a filter).
+    
+    Otherwise, when DYNAMODB_CLASSIFICATION_INDEX_NAME is configured, we
+    issue one Query per classification in STEP_CLASSIFICATIONS_FILTER
+    (partition key step_classification, sort key created_at), so rows of
+    other classifications are never read.
+    
+    Without either index we fall back to a full table Scan with every
+    predicate in the FilterExpression.
+    
+    Args:
+        command: Exact command string to match
+        app_package: App package to filter by
+        start_date: Optional start date
+        end_date: Optional end date
+        
+    Returns:
+        Tuple of (operation name: 'query' or 'scan', list of request kwargs)
+    """
+    (filter_expression, expression_values) = _build_command_filter(
+        command, app_package, start_date, end_date
+    )
+    has_date_range = bool(start_date and end_date)
+    
+    if config.DYNAMODB_COMMAND_INDEX_NAME:
+        key_condition = 'app_package = :app_package'
+        if has_date_range:
+            key_condition += ' AND created_at BETWEEN :start_date AND :end_date'
+        
+        return 'query', [{
+            'TableName': config.DYNAMODB_TABLE_NAME,
+            'IndexName': config.DYNAMODB_COMMAND_INDEX_NAME,
+            'KeyConditionExpression': key_condition,
+            'FilterExpression': 'command = :command AND step_classification IN (:tap, :text)',
+            'ExpressionAttributeValues': expression_values
+        }]
+    
+    if config.DYNAMODB_CLASSIFICATION_INDEX_NAME:
+        key_condition = 'step_classification = :classification'
+        if has_date_range:
+            key_condition += ' AND created_at BETWEEN :start_date AND :end_date'
+        
+        # DynamoDB rejects unused placeholders, so drop :tap/:text
+        partition_values = {
+            name: value for name, value in expression_values.items()
+            if name not in _BASE_EXPR_VALUES
+        }
+        
+        return 'query', [
+            {
+                'TableName': config.DYNAMODB_TABLE_NAME,
+                'IndexName': config.DYNAMODB_CLASSIFICATION_INDEX_NAME,
+                'KeyConditionExpression': key_condition,
+                'FilterExpression': 'command = :command AND app_package = :app_package',
+                'ExpressionAttributeValues': {
+                    **partition_values,
+                    ':classification': _CLASSIFICATION_VALUES[classification]
+                }
+            }
+            for classification in STEP_CLASSIFICATIONS_FILTER
+        ]
+    
+    return 'scan', [{
+        'TableName': config.DYNAMODB_TABLE_NAME,
+        'FilterExpression': filter_expression,
+        'ExpressionAttributeValues': expression_values
+    }]
+
+
+# Attributes fetched for each step by default: exactly the StepInfo fields,
+# which cover everything the analyzer and classifier read. Wide attributes
+# that nothing downstream uses are never sent over the wire.
+STEP_PROJECTION: Tuple[str, ...] = tuple(f.name for f in fields(StepInfo))
+
+
+def build_projection(attribute_names: Tuple[str, ...]) -> Tuple[str, Dict[str, str]]:
+    """
+    Build a ProjectionExpression with placeholder names.
+    
+    Every attribute is aliased (e.g. created_at -> #p_created_at) so the
+    projection can never collide with DynamoDB reserved words.
+    
+    Args:
+        attribute_names: Attributes to return
+        
+    Returns:
+        Tuple of (ProjectionExpression, ExpressionAttributeNames)
+    """
+    attribute_aliases = {f"#p_{name}": name for name in attribute_names}
+    return ', '.join(attribute_aliases), attribute_aliases
+
+
+# ============================================================================
+# RATE LIMITING - Client-Side Read Capacity Cap
+# ============================================================================
+
+class CapacityRateLimiter:
+    """
+    Pace requests so consumed read capacity stays under a per-second cap.
+    
+    Each response's ConsumedCapacity pushes the earliest start time of
+    the next request forward by units / units_per_second. The schedule is
+    shared (and locked) across parallel workers, so the cap applies to the
+    whole scan. Throttling errors that still happen are retried by
+    botocore's adaptive retry mode.
+    """
+    
+    def __init__(self, units_per_second: float):
+        self.units_per_second = units_per_second
+        self._next_request_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Sleep until the next request is allowed."""
+        with self._lock:
+            delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def consume(self, units: float) -> None:
+        """Account for capacity used by a completed request."""
+        with self._lock:
+            start = max(time.monotonic(), self._next_request_at)
+            self._next_request_at = start + units / self.units_per_second
+
+
+def rate_limited(
+    fetch_page: Callable[..., Dict],
+    limiter: CapacityRateLimiter
+) -> Callable[..., Dict]:
+    """
+    Wrap client.scan/client.query so every page is paced by the limiter.
+    
+    Args:
+        fetch_page: Bound client method (client.scan or client.query)
+        limiter: Shared rate limiter
+        
+    Returns:
+        Callable with the same signature as fetch_page
+    """
+    def fetch_rate_limited_page(**request_kwargs) -> Dict:
+        limiter.wait()
+        response = fetch_page(ReturnConsumedCapacity='TOTAL', **request_kwargs)
+        limiter.consume(response.get('ConsumedCapacity', {}).get('CapacityUnits', 0))
+        return response
+    
+    return fetch_rate_limited_page
+
+
+# ============================================================================
+# SCAN CHECKPOINTS - Resume Long Scans After a Failure
+# ============================================================================
+
+class ScanCheckpoint:
+    """
+    Persist each worker's LastEvaluatedKey so a failed scan can resume.
+    
+    The checkpoint file maps worker index (Scan segment or Query
+    partition) to the key to resume from, or None once that worker has
+    finished. It is advanced only after the caller has consumed a page,
+    and rewritten atomically (temp file + os.replace). A scan that
+    completes cleanly, or is closed early by its consumer, deletes its
+    checkpoint; it is kept only when the scan fails with an error.
+    
+    Note: on resume, steps from pages consumed by the failed run are
+    not yielded again, so the run's totals are partial. This is logged
+    as a warning and exposed as `resumed`.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.state: Dict[str, Optional[Dict]] = {}
+        self.resumed = self.path.exists()
+        
+        if self.resumed:
+            self.state = orjson.loads(self.path.read_bytes())
+            logger.warning(
+                "Resuming scan from checkpoint %s: steps consumed by the previous "
+                "run are not yielded again, so this run's totals are partial",
+                self.path
+            )
+    
+    @classmethod
+    def for_command(
+        cls,
+        checkpoint_dir: Path,
+        command: str,
+        app_package: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        total_segments: int
+    ) -> 'ScanCheckpoint':
+        """
+        Open the checkpoint for a command scan.
+        
+        The file name hashes everything that shapes the requests, so a
+        key is never reused against a different segment/index layout.
+        """
+        scan_identity = orjson.dumps([
+            command.strip(), app_package.strip(), start_date, end_date, total_segments,
+            config.DYNAMODB_COMMAND_INDEX_NAME, config.DYNAMODB_CLASSIFICATION_INDEX_NAME
+        ])
+        digest = hashlib.blake2b(scan_identity, digest_size=16).hexdigest()
+        return cls(Path(checkpoint_dir) / f"{digest}.json")
+    
+    def resume(self, worker: int, request_kwargs: Dict) -> bool:
+        """
+        Apply the saved start key for a worker.
+        
+        Returns:
+            False if this worker already finished in a previous run
+        """
+        worker_key = str(worker)
+        if worker_key not in self.state:
+            return True
+        if self.state[worker_key] is None:
+            return False
+        request_kwargs['ExclusiveStartKey'] = self.state[worker_key]
+        return True
+    
+    def advance(self, worker: int, response: Dict) -> None:
+        """Record that a worker's page has been consumed."""
+        self.state[str(worker)] = response.get('LastEvaluatedKey')
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        temp_path.write_bytes(orjson.dumps(self.state))
+        os.replace(temp_path, self.path)
+    
+    def clear(self) -> None:
+        """Delete the checkpoint after a clean run."""
+        if self.path.exists():
+            os.unlink(self.path)
+
+
+# ============================================================================
+# PAGE ITERATION - Sequential and Parallel Segmented
+# ============================================================================
+
+# Default number of parallel Scan segments when no GSI is available
+DEFAULT_TOTAL_SEGMENTS = 8
+
+# Default page_limit: resolve config.SCAN_PAGE_LIMIT at call time
+USE_CONFIGURED_PAGE_LIMIT = -1
+
+# Sentinel posted by each parallel worker when it has no more pages
+_WORKER_DONE = object()
+
+
+def iter_response_pages(
+    fetch_page: Callable[..., Dict],
+    request_kwargs: Dict,
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Iterator[Dict]:
+    """
+    Yield raw DynamoDB responses page by page, following LastEvaluatedKey.
+    
+    Args:
+        fetch_page: Bound client method (client.scan or client.query)
+        request_kwargs: Request parameters (updated with ExclusiveStartKey)
+        checkpoint: Optional checkpoint to resume from and advance
+        
+    Yields:
+        Dict: One DynamoDB response per page
+    """
+    if checkpoint and not checkpoint.resume(0, request_kwargs):
+        return
+    
+    while True:
+        response = fetch_page(**request_kwargs)
+        yield response
+        
+        if checkpoint:
+            checkpoint.advance(0, response)
+        
+        # Check if there are more pages
+        if 'LastEvaluatedKey' not in response:
+            break  # No more pages, exit loop
+        
+        # Set starting point for next page
+        request_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def iter_prefetched_pages(
+    fetch_page: Callable[..., Dict],
+    request_kwargs: Dict,
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Iterator[Dict]:
+    """
+    Like iter_response_pages(), but request the next page in the
+    background as soon as the current one arrives.
+    
+    The caller processes page N while page N+1 is in flight on a single
+    worker thread, so network time overlaps item conversion.
+    
+    Args:
+        fetch_page: Bound client method (client.scan or client.query)
+        request_kwargs: Request parameters (updated with ExclusiveStartKey)
+        checkpoint: Optional checkpoint to resume from and advance
+        
+    Yields:
+        Dict: One DynamoDB response per page
+    """
+    if checkpoint and not checkpoint.resume(0, request_kwargs):
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, **request_kwargs)
+        while True:
+            response = future.result()
+            has_more_pages = 'LastEvaluatedKey' in response
+            
+            # Start fetching the next page before handing this one out
+            if has_more_pages:
+                request_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+                future = executor.submit(fetch_page, **request_kwargs)
+            
+            yield response
+            
+            if checkpoint:
+                checkpoint.advance(0, response)
+            
+            if not has_more_pages:
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_parallel_pages(
+    fetch_page: Callable[..., Dict],
+    request_kwargs_list: List[Dict],
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Iterator[Dict]:
+    """
+    Yield responses from several independent paginated requests run in parallel.
+    
+    Each request (a Scan segment, or a Query on one index partition) is
+    paginated by its own worker thread (boto3 releases the GIL while
+    waiting on HTTP), and pages are handed to the caller through a
+    bounded queue. Each request tracks its own LastEvaluatedKey.
+    Page order across requests is not deterministic.
+    
+    Args:
+        fetch_page: Bound client method (client.scan or client.query)
+        request_kwargs_list: One parameter dict per worker (modified in place)
+        checkpoint: Optional checkpoint to resume from and advance
+        
+    Yields:
+        Dict: One DynamoDB response per page, from any request
+        
+    Raises:
+        Exception: Re-raises the first error hit by any worker
+    """
+    worker_count = len(request_kwargs_list)
+    pages: queue.Queue = queue.Queue(maxsize=worker_count * 2)
+    stop = threading.Event()
+    
+    def put(entry) -> bool:
+        # Bounded put that gives up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                pages.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def run_request(worker: int, request_kwargs: Dict) -> None:
+        try:
+            if checkpoint and not checkpoint.resume(worker, request_kwargs):
+                return
+            for response in iter_response_pages(fetch_page, request_kwargs):
+                if not put((worker, response)):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_WORKER_DONE)
+    
+    executor = ThreadPoolExecutor(max_workers=worker_count)
+    try:
+        for worker, request_kwargs in enumerate(request_kwargs_list):
+            executor.submit(run_request, worker, request_kwargs)
+        
+        finished_workers = 0
+        while finished_workers < worker_count:
+            entry = pages.get()
+            if entry is _WORKER_DONE:
+                finished_workers += 1
+            elif isinstance(entry, Exception):
+                raise entry
+            else:
+                worker, response = entry
+                yield response
+                
+                # Only record progress once the caller is done with the page
+                if checkpoint:
+                    checkpoint.advance(worker, response)
+    finally:
+        # Unblock any worker still waiting on the queue (error or early close)
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+def iter_parallel_scan_pages(
+    fetch_page: Callable[..., Dict],
+    scan_kwargs: Dict,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Iterator[Dict]:
+    """
+    Yield Scan responses from N segments scanned in parallel.
+    
+    DynamoDB can split a Scan into independent segments; each one is
+    paginated by its own worker via iter_parallel_pages().
+    
+    Args:
+        fetch_page: Bound client.scan method
+        scan_kwargs: Base Scan parameters (not modified)
+        total_segments: Number of parallel segments
+        checkpoint: Optional checkpoint to resume from and advance
+        
+    Yields:
+        Dict: One DynamoDB response per page, from any segment
+    """
+    return iter_parallel_pages(fetch_page, [
+        dict(scan_kwargs, Segment=segment, TotalSegments=total_segments)
+        for segment in range(total_segments)
+    ], checkpoint)
+
+
 # ============================================================================
 # COMMAND-SPECIFIC SCANNING WITH PAGINATION
 # ============================================================================
 
+def open_command_pages(
+    command: str,
+    app_package: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+    projection: Optional[Tuple[str, ...]] = STEP_PROJECTION,
+    page_limit: Optional[int] = None,
+    count_only: bool = False,
+    checkpoint: Optional[ScanCheckpoint] = None
+) -> Tuple[str, Iterator[Dict]]:
+    """
+    Build the command request(s) and return a lazy iterator over their pages.
+    
+    A single Query is paged sequentially (prefetching the next page);
+    per-classification Queries and Scan segments run in parallel. No request is sent until the returned
+    iterator is consumed.
+    
+    Args:
+        command: Exact command string to match
+        app_package: App package to filter by
+        start_date: Optional start date
+        end_date: Optional end date
+        total_segments: Parallel Scan segments for the fallback path (1 = sequential)
+        projection: Attributes to fetch (None = all attributes)
+        page_limit: Optional DynamoDB Limit (items evaluated per page)
+        count_only: Use Select='COUNT' to return counts instead of items
+        checkpoint: Optional checkpoint to resume from and advance
+        
+    Returns:
+        Tuple of (operation name: 'query' or 'scan', page iterator)
+    """
+    client = get_dynamodb_client()
+    
+    # Build request parameters (Query on a GSI if configured, Scan otherwise)
+    operation, request_kwargs_list = build_command_requests(command, app_package, start_date, end_date)
+    fetch_page = getattr(client, operation)
+    
+    if config.SCAN_RCU_CAP > 0:
+        fetch_page = rate_limited(fetch_page, CapacityRateLimiter(config.SCAN_RCU_CAP))
+    
+    for request_kwargs in request_kwargs_list:
+        if count_only:
+            request_kwargs['Select'] = 'COUNT'  # Only return count, not items
+        elif projection:
+            # Only fetch the attributes we actually use
+            request_kwargs['ProjectionExpression'], request_kwargs['ExpressionAttributeNames'] = build_projection(projection)
+        
+        if page_limit:
+            request_kwargs['Limit'] = page_limit
+    
+    if len(request_kwargs_list) > 1:
+        logger.info(f"Parallel queries: {len(request_kwargs_list)}")
+        return operation, iter_parallel_pages(fetch_page, request_kwargs_list, checkpoint)
+    
+    if operation == 'scan' and total_segments > 1:
+        logger.info(f"Parallel scan segments: {total_segments}")
+        return operation, iter_parallel_scan_pages(fetch_page, request_kwargs_list[0], total_segments, checkpoint)
+    
+    return operation, iter_prefetched_pages(fetch_page, request_kwargs_list[0], checkpoint)
+
+
 def scan_command_steps_with_pagination(
     command: str,
     app_package: str,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+    projection: Optional[Tuple[str, ...]] = STEP_PROJECTION,
+    checkpoint_dir: Optional[Path] = None,
+    page_limit: Optional[int] = USE_CONFIGURED_PAGE_LIMIT
 ) -> Iterator[Dict]:
     """
     Scan TestSteps table for specific command and package with pagination.
@@ -84,12 +698,22 @@ def scan_command_steps_with_pagination(
     - Optional date range filtering
     - Generator pattern for memory efficiency
     - Pagination support for large datasets
+    - Parallel segmented Scan when the GSI Query path is not configured
     
     Args:
         command: Exact command string to match (e.g., "Tap on Submit Button")
         app_package: App package to filter by (e.g., "in.swiggy.android.instamart")
         start_date: Optional start date in IST format (e.g., "2025-09-28")
         end_date: Optional end date in IST format (e.g., "2025-10-08")
+        total_segments: Parallel Scan segments for the fallback path (1 = sequential)
+        projection: Attributes to fetch (default: StepInfo fields, None = all attributes)
+        checkpoint_dir: Optional directory for resume checkpoints (see ScanCheckpoint).
+            A rerun after a failure continues where the failed run stopped
+            (logged as a warning: its totals are partial). Closing the
+            generator early discards the checkpoint; so does an exception
+            raised by the consumer while iterating, since the generator
+            only sees it as GeneratorExit when it is closed.
+        page_limit: Items evaluated per page (default: config.SCAN_PAGE_LIMIT, None/0 = 1MB pages)
     
     Yields:
         Dict: DynamoDB items (in DynamoDB JSON format)
@@ -113,49 +737,33 @@ def scan_command_steps_with_pagination(
     if not app_package or not app_package.strip():
         raise ValueError("App package cannot be empty")
     
-    client = get_dynamodb_client()
-    
-    # Build scan parameters with multiple filters
-    # We use AND conditions to combine all our filters
-    filter_conditions = [
-        'step_classification IN (:tap, :text)',  # Existing filter
-        'command = :command',                    # Exact command match
-        'app_package = :app_package'             # App package match
-    ]
-    
-    # Add date range filter if provided
-    if start_date and end_date:
-        filter_conditions.append('created_at BETWEEN :start_date AND :end_date')
-    
-    # Combine all conditions with AND
-    filter_expression = ' AND '.join(filter_conditions)
+    if page_limit == USE_CONFIGURED_PAGE_LIMIT:
+        page_limit = config.SCAN_PAGE_LIMIT
     
-    # Build expression attribute values
-    expression_values = {
-        ':tap': {'S': 'TAP'},
-        ':text': {'S': 'TEXT'},
-        ':command': {'S': command.strip()},  # Exact match, trimmed
-        ':app_package': {'S': app_package.strip()}  # Exact match, trimmed
-    }
-    
-    # Add date range values if provided
-    if start_date and end_date:
-        expression_values[':start_date'] = {'S': start_date}
-        expression_values[':end_date'] = {'S': end_date}
+    checkpoint = None
+    if checkpoint_dir:
+        checkpoint = ScanCheckpoint.for_command(
+            checkpoint_dir, command, app_package, start_date, end_date, total_segments
+        )
     
-    # Build scan parameters
-    scan_kwargs = {
-        'TableName': DYNAMODB_TABLE_NAME,
-        'FilterExpression': filter_expression,
-        'ExpressionAttributeValues': expression_values
-    }
+    operation, pages = open_command_pages(
+        command, app_package, start_date, end_date, total_segments, projection,
+        page_limit=page_limit, checkpoint=checkpoint
+    )
     
     # Track statistics for logging
     scanned_count = 0  # Total items scanned by DynamoDB
     yielded_count = 0  # Total items yielded to caller
     page_count = 0     # Number of pages processed
+    log_progress = logger.isEnabledFor(logging.INFO)
     
-    logger.info(f"Starting command-specific scan of table: {DYNAMODB_TABLE_NAME}")
+    if operation == 'query':
+        logger.info(
+            f"Starting command-specific query of index: "
+            f"{config.DYNAMODB_COMMAND_INDEX_NAME or config.DYNAMODB_CLASSIFICATION_INDEX_NAME}"
+        )
+    else:
+        logger.info(f"Starting command-specific scan of table: {config.DYNAMODB_TABLE_NAME}")
     logger.info(f"Command: '{command}'")
     logger.info(f"App Package: '{app_package}'")
     logger.info(f"Step Classifications: {STEP_CLASSIFICATIONS_FILTER}")
@@ -167,15 +775,12 @@ def scan_command_steps_with_pagination(
     
     try:
         # Pagination loop - same pattern as existing scanner
-        while True:
+        for response in pages:
             page_count += 1
             
-            # Perform scan operation
-            response = client.scan(**scan_kwargs)
-            
             # Get items from this page
             items = response.get('Items', [])
-            scanned_count += len(items)
+            scanned_count += response.get('ScannedCount', len(items))
             
             # Yield items one by one (Generator pattern)
             for item in items:
@@ -184,20 +789,21 @@ def scan_command_steps_with_pagination(
                 converted_item = convert_dynamodb_item_to_dict(item)
                 yield converted_item  # This is what makes it a generator
             
-            # Log progress every 5 pages
-            if page_count % 5 == 0:
+            # Log progress every 5 pages (lazy %-formatting, skipped if INFO is off)
+            if page_count % 5 == 0 and log_progress:
                 logger.info(
-                    f"Progress: Page {page_count}, "
-                    f"Scanned: {scanned_count}, "
-                    f"Yielded: {yielded_count}"
+                    "Progress: Page %d, Scanned: %d, Yielded: %d",
+                    page_count, scanned_count, yielded_count
                 )
-            
-            # Check if there are more pages
-            if 'LastEvaluatedKey' not in response:
-                break  # No more pages, exit loop
-            
-            # Set starting point for next page
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    except GeneratorExit:
+        # Consumer stopped early (break/close): not a failure, so a rerun
+        # must start over instead of silently resuming a partial scan.
+        # Closing the pages first stops any further checkpoint writes.
+        pages.close()
+        if checkpoint:
+            checkpoint.clear()
+        raise
     
     except ClientError as e:
         # Handle DynamoDB-specific errors
@@ -213,11 +819,12 @@ def scan_command_steps_with_pagination(
         logger.error(f"Command: '{command}', Package: '{app_package}'")
         raise
     
+    # Clean completion - nothing left to resume
+    if checkpoint:
+        checkpoint.clear()
+    
     # Final statistics
-    logger.info(
-        f"Command scan complete. Pages: {page_count}, "
-        f"Total items: {yielded_count}"
-    )
+    logger.info("Command scan complete. Pages: %d, Total items: %d", page_count, yielded_count)
     
     if yielded_count == 0:
         logger.warning(
@@ -225,6 +832,77 @@ def scan_command_steps_with_pagination(
         )
 
 
+def scan_command_steps_in_batches(
+    command: str,
+    app_package: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    batch_size: int = 500,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+    projection: Optional[Tuple[str, ...]] = STEP_PROJECTION
+) -> Iterator[List[Dict]]:
+    """
+    Scan for a command like scan_command_steps_with_pagination(), but
+    yield lists of converted items instead of one item at a time.
+    
+    Pages are merged until at least batch_size items are buffered, so
+    downstream bulk consumers (JSON dumps, DataFrames) pay the generator
+    overhead once per batch. DynamoDB's page size is capped with
+    Limit=min(batch_size, 1000).
+    
+    Args:
+        command: Exact command string to match
+        app_package: App package to filter by
+        start_date: Optional start date in IST format
+        end_date: Optional end date in IST format
+        batch_size: Minimum number of items per yielded batch (last may be smaller)
+        total_segments: Parallel Scan segments for the fallback path (1 = sequential)
+        projection: Attributes to fetch (default: StepInfo fields, None = all attributes)
+    
+    Yields:
+        List[Dict]: Converted items (regular Python dicts)
+    
+    Raises:
+        ClientError: If DynamoDB operation fails
+        ValueError: If command, app_package or batch_size is invalid
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be at least 1")
+    
+    validate_command_inputs(command, app_package)
+    
+    _, pages = open_command_pages(
+        command, app_package, start_date, end_date,
+        total_segments, projection, page_limit=min(batch_size, 1000)
+    )
+    
+    batch: List[Dict] = []
+    yielded_count = 0
+    
+    try:
+        for response in pages:
+            batch.extend(map(convert_dynamodb_item_to_dict, response.get('Items', [])))
+            
+            if len(batch) >= batch_size:
+                yielded_count += len(batch)
+                yield batch
+                batch = []
+        
+        # Final partial batch
+        if batch:
+            yielded_count += len(batch)
+            yield batch
+    
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        error_message = e.response['Error']['Message']
+        logger.error(f"DynamoDB error ({error_code}): {error_message}")
+        logger.error(f"Command: '{command}', Package: '{app_package}'")
+        raise
+    
+    logger.info(f"Batched command scan complete. Total items: {yielded_count}")
+
+
 # ============================================================================
 # UTILITY FUNCTIONS - Helper Functions for Command Scanning
 # ============================================================================
@@ -260,72 +938,44 @@ def get_scan_statistics(
     command: str,
     app_package: str,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    total_segments: int = DEFAULT_TOTAL_SEGMENTS
 ) -> Dict[str, int]:
     """
     Get quick statistics about a command without loading all data.
     
-    This performs a count-only scan to get statistics without
-    loading all the step data into memory.
+    This performs a count-only request (Select='COUNT') to get statistics
+    without loading all the step data into memory. When a GSI is
+    configured this is a Query, so read capacity is proportional to the
+    steps for the package/classification rather than to the table size.
     
     Args:
         command: Command to analyze
         app_package: App package to filter by
         start_date: Optional start date
         end_date: Optional end date
+        total_segments: Parallel Scan segments for the fallback path (1 = sequential)
         
     Returns:
         Dict with scan statistics
     """
     validate_command_inputs(command, app_package)
     
-    client = get_dynamodb_client()
-    
-    # Build the same filter expression as the main scan
-    filter_conditions = [
-        'step_classification IN (:tap, :text)',
-        'command = :command',
-        'app_package = :app_package'
-    ]
-    
-    if start_date and end_date:
-        filter_conditions.append('created_at BETWEEN :start_date AND :end_date')
-    
-    filter_expression = ' AND '.join(filter_conditions)
-    
-    expression_values = {
-        ':tap': {'S': 'TAP'},
-        ':text': {'S': 'TEXT'},
-        ':command': {'S': command.strip()},
-        ':app_package': {'S': app_package.strip()}
-    }
-    
-    if start_date and end_date:
-        expression_values[':start_date'] = {'S': start_date}
-        expression_values[':end_date'] = {'S': end_date}
-    
-    # Use Select='COUNT' to get only the count, not the data
-    scan_kwargs = {
-        'TableName': DYNAMODB_TABLE_NAME,
-        'FilterExpression': filter_expression,
-        'ExpressionAttributeValues': expression_values,
-        'Select': 'COUNT'  # Only return count, not items
-    }
+    # Same request(s) as the main scan, with Select='COUNT' so only the
+    # count is returned, not the data
+    _, pages = open_command_pages(
+        command, app_package, start_date, end_date,
+        total_segments, projection=None, count_only=True
+    )
     
+    # Counts simply sum across pages (and across segments/partitions)
     total_count = 0
     page_count = 0
     
     try:
-        while True:
+        for response in pages:
             page_count += 1
-            response = client.scan(**scan_kwargs)
-            
             total_count += response.get('Count', 0)
-            
-            if 'LastEvaluatedKey' not in response:
-                break
-            
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
     
     except ClientError as e:
         logger.error(f"Error getting scan statistics: {e}")
@@ -360,8 +1010,19 @@ def test_command_exists(
         True if command exists, False otherwise
     """
     try:
-        stats = get_scan_statistics(command, app_package, start_date, end_date)
-        return stats['total_steps'] > 0
+        validate_command_inputs(command, app_package)
+        
+        _, pages = open_command_pages(
+            command, app_package, start_date, end_date,
+            projection=None, count_only=True
+        )
+        
+        # Stop at the first page with a match instead of counting everything
+        for response in pages:
+            if response.get('Count', 0) > 0:
+                pages.close()
+                return True
+        return False
     except Exception as e:
         logger.error(f"Error testing command existence: {e}")
         return False
@@ -397,34 +1058,28 @@ def list_available_commands(
     
     client = get_dynamodb_client()
     
-    # Build filter for app package and step classification
-    filter_conditions = [
-        'step_classification IN (:tap, :text)',
-        'app_package = :app_package'
-    ]
-    
-    if start_date and end_date:
-        filter_conditions.append('created_at BETWEEN :start_date AND :end_date')
-    
-    filter_expression = ' AND '.join(filter_conditions)
-    
-    expression_values = {
-        ':tap': {'S': 'TAP'},
-        ':text': {'S': 'TEXT'},
-        ':app_package': {'S': app_package.strip()}
-    }
+    try:
+        return _list_commands_with_partiql(client, app_package, limit, start_date, end_date)
+    except ClientError as e:
+        # PartiQL may be unavailable (e.g. older DynamoDB Local); fall back to Scan
+        logger.warning(f"PartiQL command listing failed, falling back to Scan: {e}")
     
-    if start_date and end_date:
-        expression_values[':start_date'] = {'S': start_date}
-        expression_values[':end_date'] = {'S': end_date}
+    # Same filter as the command scan, without the command term
+    (filter_expression, expression_values) = _build_command_filter(
+        None, app_package, start_date, end_date
+    )
     
     scan_kwargs = {
-        'TableName': DYNAMODB_TABLE_NAME,
+        'TableName': config.DYNAMODB_TABLE_NAME,
         'FilterExpression': filter_expression,
         'ExpressionAttributeValues': expression_values,
         'ProjectionExpression': 'command'  # Only return command field
     }
     
+    # Smaller pages let us stop soon after enough commands are found
+    if config.SCAN_PAGE_LIMIT:
+        scan_kwargs['Limit'] = config.SCAN_PAGE_LIMIT
+    
     commands = set()
     
     try:
@@ -444,4 +1099,68 @@ def list_available_commands(
         logger.error(f"Error listing commands: {e}")
         raise
     
-    return list(commands)[:limit]
\ No newline at end of file
+    return list(commands)[:limit]
+
+
+def _list_commands_with_partiql(
+    client,
+    app_package: str,
+    limit: int,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> List[str]:
+    """
+    List distinct commands with a PartiQL SELECT.
+    
+    Only the command attribute is projected, and each page is capped at
+    limit * 5 evaluated items so we stop reading as soon as enough
+    distinct commands have been collected.
+    
+    Args:
+        client: DynamoDB client
+        app_package: App package to search in
+        limit: Maximum number of commands to return
+        start_date: Optional start date filter
+        end_date: Optional end date filter
+        
+    Returns:
+        List of unique commands found
+        
+    Raises:
+        ClientError: If the statement fails (caller falls back to Scan)
+    """
+    where_conditions = [
+        'step_classification IN [?, ?]',
+        'app_package = ?',
+        'command IS NOT MISSING'
+    ]
+    parameters = [*_BASE_EXPR_VALUES.values(), {'S': app_package.strip()}]
+    
+    if start_date and end_date:
+        where_conditions.append('created_at BETWEEN ? AND ?')
+        parameters += [{'S': start_date}, {'S': end_date}]
+    
+    statement_kwargs = {
+        'Statement': (
+            f'SELECT command FROM "{config.DYNAMODB_TABLE_NAME}" '
+            f'WHERE {" AND ".join(where_conditions)}'
+        ),
+        'Parameters': parameters,
+        'Limit': limit * 5
+    }
+    
+    commands = set()
+    
+    while len(commands) < limit:
+        response = client.execute_statement(**statement_kwargs)
+        
+        for item in response.get('Items', []):
+            if 'command' in item and item['command'].get('S'):
+                commands.add(item['command']['S'])
+        
+        if 'NextToken' not in response:
+            break
+        
+        statement_kwargs['NextToken'] = response['NextToken']
+    
+    return list(commands)[:limit]
@@ -12,27 +12,90 @@ Why separate config?
 - Single source of truth for configuration
 """
 
+import functools
 import os
-from typing import List
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-# This reads the .env file and sets them in os.environ
-load_dotenv()
+from types import MappingProxyType
+from typing import Any, List, Mapping
 
 # ============================================================================
 # AWS CONFIGURATION
 # ============================================================================
+# Environment-driven settings are resolved lazily: the .env file is only
+# read the first time one of them is accessed (via the module-level
+# __getattr__ below), so modules that only need the business constants
+# import config without any file I/O or AWS credentials.
+#
+# Existing imports keep working unchanged:
+#     from config import AWS_REGION, DYNAMODB_TABLE_NAME
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> Mapping[str, Any]:
+    """
+    Load the .env file and read all environment-driven settings once.
+    
+    Returns:
+        Read-only mapping of setting name to value
+    """
+    from dotenv import load_dotenv
+    
+    # Load environment variables from .env file
+    # This reads the .env file and sets them in os.environ
+    load_dotenv()
+    
+    return MappingProxyType({
+        # AWS Credentials
+        # os.getenv() reads from environment variables with a fallback default
+        'AWS_ACCESS_KEY_ID': os.getenv('AWS_ACCESS_KEY_ID', ''),
+        'AWS_SECRET_ACCESS_KEY': os.getenv('AWS_SECRET_ACCESS_KEY', ''),
+        'AWS_REGION': os.getenv('AWS_REGION', 'ap-south-1'),
+        
+        # DynamoDB Settings
+        'DYNAMODB_TABLE_NAME': os.getenv('DYNAMODB_TABLE_NAME', 'TestSteps'),
+        'DYNAMODB_HOST': os.getenv('DYNAMODB_HOST', None),  # None = use AWS, URL = local
+        
+        # Global Secondary Index for command lookups
+        # Partition key: app_package, sort key: created_at
+        # None = fall back to a filtered table Scan, name = Query this index
+        'DYNAMODB_COMMAND_INDEX_NAME': os.getenv('DYNAMODB_COMMAND_INDEX_NAME', None),
+        
+        # Global Secondary Index partitioned by step classification
+        # Partition key: step_classification, sort key: created_at
+        # Used when DYNAMODB_COMMAND_INDEX_NAME is not set: one Query per classification
+        'DYNAMODB_CLASSIFICATION_INDEX_NAME': os.getenv('DYNAMODB_CLASSIFICATION_INDEX_NAME', None),
+        
+        # Client-side cap on read capacity units per second consumed by command scans
+        # (shared across parallel workers). 0 = no cap, rely on adaptive retries only
+        'SCAN_RCU_CAP': float(os.getenv('SCAN_RCU_CAP', '0')),
+        
+        # Items evaluated per Scan/Query page for command scans
+        # Smaller pages return sooner so processing overlaps the next request
+        # 0 = DynamoDB default (up to 1MB per page)
+        'SCAN_PAGE_LIMIT': int(os.getenv('SCAN_PAGE_LIMIT', '500')),
+    })
+
 
-# AWS Credentials
-# os.getenv() reads from environment variables with a fallback default
-AWS_ACCESS_KEY_ID: str = os.getenv('AWS_ACCESS_KEY_ID', '')
-AWS_SECRET_ACCESS_KEY: str = os.getenv('AWS_SECRET_ACCESS_KEY', '')
-AWS_REGION: str = os.getenv('AWS_REGION', 'ap-south-1')
+def __getattr__(name: str) -> Any:
+    """Resolve environment-driven settings on first access (PEP 562)."""
+    if not name.startswith('__'):
+        settings = _load_config()
+        if name in settings:
+            return settings[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# DynamoDB Settings
-DYNAMODB_TABLE_NAME: str = os.getenv('DYNAMODB_TABLE_NAME', 'TestSteps')
-DYNAMODB_HOST: str = os.getenv('DYNAMODB_HOST', None)  # None = use AWS, URL = local
+
+def validate_aws_credentials() -> None:
+    """
+    Ensure AWS credentials are set before talking to DynamoDB.
+    
+    Raises:
+        ValueError: If AWS_ACCESS_KEY_ID or AWS_SECRET_ACCESS_KEY is missing
+    """
+    settings = _load_config()
+    if not settings['AWS_ACCESS_KEY_ID'] or not settings['AWS_SECRET_ACCESS_KEY']:
+        raise ValueError(
+            "AWS credentials not found! Please set AWS_ACCESS_KEY_ID and "
+            "AWS_SECRET_ACCESS_KEY in .env file"
+        )
 
 # ============================================================================
 # BUSINESS LOGIC CONSTANTS
@@ -57,10 +120,3 @@ CACHE_READ_STATUS_FILTER: List[int] = [-1, 0]
 
 # Default directory for saving reports
 DEFAULT_OUTPUT_DIR: str = './cache_reports'
-
-# Validation: Ensure required variables are set
-if not AWS_ACCESS_KEY_ID or not AWS_SECRET_ACCESS_KEY:
-    raise ValueError(
-        "AWS credentials not found! Please set AWS_ACCESS_KEY_ID and "
-        "AWS_SECRET_ACCESS_KEY in .env file"
-    )
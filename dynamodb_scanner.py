@@ -12,8 +12,14 @@ Why Generator?
 - Perfect for large tables (1000s of rows)
 """
 
+import functools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
-from typing import Iterator, Dict, Optional
+from typing import Iterator, Dict, List, Optional, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from config import (
@@ -22,7 +28,7 @@ from config import (
     AWS_REGION,
     DYNAMODB_TABLE_NAME,
     DYNAMODB_HOST,
-    STEP_CLASSIFICATIONS_FILTER
+    validate_aws_credentials
 )
 from utils import logger
 
@@ -31,20 +37,36 @@ from utils import logger
 # DYNAMODB CLIENT SETUP
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_dynamodb_client():
     """
-    Create and return boto3 DynamoDB client.
+    Create and return the shared boto3 DynamoDB client.
+    
+    The client is built once per process and reused, so repeated scans
+    skip botocore session/endpoint setup and keep HTTPS connections
+    alive. boto3 low-level clients are thread-safe, and the connection
+    pool is sized for parallel segment scans.
     
     Uses AWS credentials from config.
     Supports both AWS DynamoDB and local DynamoDB.
     
     Returns:
         boto3 DynamoDB client
+        
+    Raises:
+        ValueError: If AWS credentials are not configured
     """
+    validate_aws_credentials()
+    
     client_config = {
         'aws_access_key_id': AWS_ACCESS_KEY_ID,
         'aws_secret_access_key': AWS_SECRET_ACCESS_KEY,
-        'region_name': AWS_REGION
+        'region_name': AWS_REGION,
+        'config': Config(
+            max_pool_connections=64,
+            retries={'mode': 'adaptive', 'max_attempts': 20},
+            tcp_keepalive=True
+        )
     }
     
     # Add host URL if using local DynamoDB
@@ -58,7 +80,68 @@ def get_dynamodb_client():
 # DYNAMODB SCANNING WITH PAGINATION
 # ============================================================================
 
-def scan_test_steps_with_pagination() -> Iterator[Dict]:
+def build_scan_filter(
+    cache_read_statuses: Optional[List[int]] = None,
+    created_at_range: Optional[Tuple[str, str]] = None
+) -> Tuple[str, Dict]:
+    """
+    Build the server-side FilterExpression for a TestSteps scan.
+    
+    The filter only pre-filters: it must never drop a row that the
+    client-side check (report_generator.make_step_filter) would keep.
+    Rows whose cache_read_status or created_at is missing or NULL (both
+    convert to None) are therefore kept, as are empty created_at strings.
+    
+    Args:
+        cache_read_statuses: Optional allowed cache_read_status values
+            (steps without the attribute, or with a NULL one, are always kept)
+        created_at_range: Optional inclusive (start, end) bounds compared
+            as strings against created_at (steps without a created_at
+            value are always kept)
+        
+    Returns:
+        Tuple of (FilterExpression, ExpressionAttributeValues)
+    """
+    filter_conditions = ['step_classification IN (:tap, :text)']
+    expression_values = {
+        ':tap': {'S': 'TAP'},
+        ':text': {'S': 'TEXT'}
+    }
+    
+    if cache_read_statuses or created_at_range:
+        expression_values[':null_type'] = {'S': 'NULL'}
+    
+    if cache_read_statuses:
+        status_placeholders = []
+        for index, status in enumerate(cache_read_statuses):
+            status_placeholders.append(f':status{index}')
+            expression_values[f':status{index}'] = {'N': str(status)}
+        filter_conditions.append(
+            f"(attribute_not_exists(cache_read_status) OR "
+            f"attribute_type(cache_read_status, :null_type) OR "
+            f"cache_read_status IN ({', '.join(status_placeholders)}))"
+        )
+    
+    if created_at_range:
+        filter_conditions.append(
+            '(attribute_not_exists(created_at) OR '
+            'attribute_type(created_at, :null_type) OR '
+            'created_at = :empty_string OR '
+            'created_at BETWEEN :created_from AND :created_to)'
+        )
+        expression_values[':empty_string'] = {'S': ''}
+        expression_values[':created_from'] = {'S': created_at_range[0]}
+        expression_values[':created_to'] = {'S': created_at_range[1]}
+    
+    return ' AND '.join(filter_conditions), expression_values
+
+
+def scan_test_steps_with_pagination(
+    segment: Optional[int] = None,
+    total_segments: Optional[int] = None,
+    cache_read_statuses: Optional[List[int]] = None,
+    created_at_range: Optional[Tuple[str, str]] = None
+) -> Iterator[Dict]:
     """
     Scan TestSteps table with pagination using generator pattern.
     
@@ -69,6 +152,7 @@ def scan_test_steps_with_pagination() -> Iterator[Dict]:
     
     Filtering:
     - Only returns steps where step_classification IN ('TAP', 'TEXT')
+    - Optionally cache_read_status and created_at (see build_scan_filter)
     - DynamoDB FilterExpression applied server-side
     
     Pagination:
@@ -76,6 +160,12 @@ def scan_test_steps_with_pagination() -> Iterator[Dict]:
     - We use LastEvaluatedKey to continue scanning
     - Loop until no more pages
     
+    Args:
+        segment: Optional segment number for a parallel scan
+        total_segments: Total segments of the parallel scan (with segment)
+        cache_read_statuses: Optional allowed cache_read_status values
+        created_at_range: Optional inclusive created_at string bounds
+    
     Yields:
         Dict: DynamoDB items (in DynamoDB JSON format)
         
@@ -89,22 +179,28 @@ def scan_test_steps_with_pagination() -> Iterator[Dict]:
     # Build scan parameters
     # FilterExpression: Server-side filtering (reduces data transfer)
     # ExpressionAttributeValues: Values to substitute in filter expression
+    filter_expression, expression_values = build_scan_filter(cache_read_statuses, created_at_range)
     scan_kwargs = {
         'TableName': DYNAMODB_TABLE_NAME,
-        'FilterExpression': 'step_classification IN (:tap, :text)',
-        'ExpressionAttributeValues': {
-            ':tap': {'S': 'TAP'},
-            ':text': {'S': 'TEXT'}
-        }
+        'FilterExpression': filter_expression,
+        'ExpressionAttributeValues': expression_values
     }
-    # add the time stramp filter here 
+    
+    # Scan only one segment of the table when part of a parallel scan
+    if total_segments:
+        scan_kwargs['Segment'] = segment
+        scan_kwargs['TotalSegments'] = total_segments
+    
     # Track statistics
     scanned_count = 0  # Total items scanned
     yielded_count = 0  # Total items yielded
     page_count = 0     # Number of pages processed
     
-    logger.info(f"Starting scan of table: {DYNAMODB_TABLE_NAME}")
-    logger.info(f"Filter: step_classification IN {STEP_CLASSIFICATIONS_FILTER}")
+    if total_segments:
+        logger.info(f"Starting scan of table: {DYNAMODB_TABLE_NAME} (segment {segment}/{total_segments})")
+    else:
+        logger.info(f"Starting scan of table: {DYNAMODB_TABLE_NAME}")
+    logger.info(f"Filter: {filter_expression}")
     
     try:
         # Pagination loop
@@ -164,60 +260,87 @@ def scan_test_steps_with_pagination() -> Iterator[Dict]:
 # PARALLEL SCANNING FOR BULK ANALYSIS
 # ============================================================================
 
-def scan_with_parallel_segments(total_segments: int = 4) -> Iterator[Dict]:
+# Sentinel posted by each segment worker when it has no more items
+_SEGMENT_DONE = object()
+
+
+def scan_with_parallel_segments(
+    total_segments: int = 4,
+    cache_read_statuses: Optional[List[int]] = None,
+    created_at_range: Optional[Tuple[str, str]] = None
+) -> Iterator[Dict]:
     """
     Scan DynamoDB table using parallel segments for maximum throughput.
     
     This function provides parallel scanning capability for bulk analysis
     where we need to process large amounts of data efficiently.
     
+    Each segment is scanned by its own worker thread, which puts raw
+    items into a bounded queue (4 items per segment) that this generator
+    drains. Network round-trips of all segments overlap with the
+    caller's processing. Item order is not deterministic.
+    
     Args:
         total_segments: Number of parallel segments (recommended: 4-8)
+        cache_read_statuses: Optional allowed cache_read_status values
+        created_at_range: Optional inclusive created_at string bounds
         
     Yields:
         Dict: DynamoDB items (in DynamoDB JSON format)
         
+    Raises:
+        Exception: Re-raises the first error hit by any segment worker
+        
     Example usage:
         >>> for item in scan_with_parallel_segments(total_segments=4):
         ...     step_id = item['step_id']['S']
         ...     print(step_id)
     """
-    import concurrent.futures
-    from concurrent.futures import ThreadPoolExecutor
-    
-    def scan_segment(segment: int) -> Iterator[Dict]:
-        """Scan a single segment of the table"""
-        client = get_dynamodb_client()
-        scan_kwargs = {
-            'TableName': DYNAMODB_TABLE_NAME,
-            'FilterExpression': 'step_classification IN (:tap, :text)',
-            'ExpressionAttributeValues': {
-                ':tap': {'S': 'TAP'},
-                ':text': {'S': 'TEXT'}
-            },
-            'Segment': segment,
-            'TotalSegments': total_segments
-        }
-        
-        while True:
-            response = client.scan(**scan_kwargs)
-            
-            for item in response.get('Items', []):
-                yield item
-            
-            if 'LastEvaluatedKey' not in response:
-                break
-            
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    items: queue.Queue = queue.Queue(maxsize=4 * total_segments)
+    stop = threading.Event()
+    
+    def put(entry) -> bool:
+        # Bounded put that gives up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                items.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def scan_segment(segment: int) -> None:
+        """Scan a single segment of the table into the queue"""
+        try:
+            for item in scan_test_steps_with_pagination(
+                segment, total_segments, cache_read_statuses, created_at_range
+            ):
+                if not put(item):
+                    return
+        except Exception as e:
+            put(e)
+        finally:
+            put(_SEGMENT_DONE)
     
     logger.info(f"Starting parallel scan with {total_segments} segments")
     
-    # Use ThreadPoolExecutor for parallel scanning
-    with ThreadPoolExecutor(max_workers=total_segments) as executor:
-        futures = [executor.submit(scan_segment, i) for i in range(total_segments)]
+    executor = ThreadPoolExecutor(max_workers=total_segments)
+    try:
+        for segment in range(total_segments):
+            executor.submit(scan_segment, segment)
         
-        for future in concurrent.futures.as_completed(futures):
-            for item in future.result():
-                yield item
+        finished_segments = 0
+        while finished_segments < total_segments:
+            entry = items.get()
+            if entry is _SEGMENT_DONE:
+                finished_segments += 1
+            elif isinstance(entry, Exception):
+                raise entry
+            else:
+                yield entry
+    finally:
+        # Unblock any worker still waiting on the queue (error or early close)
+        stop.set()
+        executor.shutdown(wait=True)
     
     logger.info("Parallel scan complete")
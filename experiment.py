@@ -1,50 +1,105 @@
+import gzip
+import sys
+from pathlib import Path
+
+import ijson
 import orjson
-import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+# Pass --full to also write every step grouped by date/command (memory: O(steps))
+FULL_GROUPING = "--full" in sys.argv
 
 DATE_WISE_COUNTER = defaultdict(list)
 
-with open("rep.json", "rb") as f:
-    report = orjson.loads(f.read())
 
-cache_read_status_list = report['report']['cache_read_status_none']["steps_list"]
-max_date = max(cache_read_status_list, key=lambda x: datetime.datetime.fromisoformat(x['created_at']))
-print(max_date["created_at"])
+def iter_report_steps(category):
+    """
+    Stream the steps of one report category without loading the whole report.
+    
+    One ijson pass over rep.json: it stops at the category's steps_file
+    (gzipped JSONL next to the report) or, for older reports, streams the
+    inline steps_list from that same pass.
+    """
+    steps_file_prefix = f"report.{category}.steps_file"
+    steps_list_prefix = f"report.{category}.steps_list"
+    
+    with open("rep.json", "rb") as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix == steps_file_prefix and event == "string":
+                steps_file = value
+                break
+            if prefix == steps_list_prefix and event == "start_array":
+                # Continue on the same event stream for the inline steps
+                yield from ijson.items(events, f"{steps_list_prefix}.item")
+                return
+        else:
+            return
+    
+    # Saved reports keep each category's steps in a gzipped JSONL file
+    with gzip.open(Path("rep.json").with_name(steps_file), "rb") as f:
+        for line in f:
+            yield orjson.loads(line)
 
-for step in cache_read_status_list:
-    date = datetime.datetime.fromisoformat(step["created_at"]).date().strftime("%Y-%m-%d")
-    DATE_WISE_COUNTER[date].append(step)
 
-for date, count in DATE_WISE_COUNTER.items():
-    print(f"{date}: {len(count)}")
+max_created_at = None
+date_counts = Counter()
+for step in iter_report_steps("cache_read_status_none"):
+    # ISO-8601 timestamps sort lexicographically in chronological order
+    if max_created_at is None or step["created_at"] > max_created_at:
+        max_created_at = step["created_at"]
+    date = step["created_at"][:10]  # YYYY-MM-DD prefix
+    date_counts[date] += 1
+    if FULL_GROUPING:
+        DATE_WISE_COUNTER[date].append(step)
+print(max_created_at)
+
+for date, count in date_counts.items():
+    print(f"{date}: {count}")
 
 with open("experiment.json", "wb") as f:
-    f.write(orjson.dumps(DATE_WISE_COUNTER, option=orjson.OPT_INDENT_2))
+    f.write(orjson.dumps(DATE_WISE_COUNTER if FULL_GROUPING else date_counts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
-cache_read_status_list = report['report']['no_cache_documents_found']["steps_list"]
-# Command Wise Count
-command_wise_counter = defaultdict(list)
-for step in cache_read_status_list:
+# Command Wise Count - one pass keeps [count, all cache_doc_status == 0, steps] per command
+command_stats = {}
+for step in iter_report_steps("no_cache_documents_found"):
     command = step['command']
-    command_wise_counter[command].append(step)
+    is_zero = step.get("cache_doc_status") == 0
+    entry = command_stats.get(command)
+    if entry is None:
+        command_stats[command] = [1, is_zero, [step] if FULL_GROUPING else None]
+    else:
+        entry[0] += 1
+        entry[1] = entry[1] and is_zero
+        if FULL_GROUPING:
+            entry[2].append(step)
 
-command_wise_counter_number = sorted([{"command": k, "count": len(v), "all_same": all(step.get("cache_doc_status", None) == 0 for step in v)} for k,v in command_wise_counter.items()], key=lambda x: x['count'], reverse=True)
+# Single pass over the aggregates for both summaries
+command_wise_counter_number = []
+never_cached_commands = []
+not_cache_count = 0
+total_count = 0
+for command, (count, all_zero, _) in command_stats.items():
+    command_wise_counter_number.append({"command": command, "count": count, "all_same": all_zero})
+    if count != 1 and all_zero:
+        never_cached_commands.append(command)
+        not_cache_count += count
+    total_count += count
+command_wise_counter_number.sort(key=lambda x: x['count'], reverse=True)
 
 import json
 print(json.dumps(command_wise_counter_number, indent=4))
 
 
 print("####################################################################")
-not_cache_count = 0
-total_count = 0
-for command, list_of_steps in command_wise_counter.items():
-    if len(list_of_steps)!=1 and all(step.get("cache_doc_status", None) == 0 for step in list_of_steps):
-        print(f"[NEVER CACHED] {command}")
-        not_cache_count += len(list_of_steps)
-    total_count += len(list_of_steps)
+for command in never_cached_commands:
+    print(f"[NEVER CACHED] {command}")
 
 print(f"Total Never Cached: {not_cache_count}")
 print(f"Total Cached: {total_count - not_cache_count}")
 
 with open("no_cache_document_found_command_wise_counter.json", "wb") as f:
-    f.write(orjson.dumps(command_wise_counter, option=orjson.OPT_INDENT_2))
\ No newline at end of file
+    f.write(orjson.dumps(
+        {command: entry[2] if FULL_GROUPING else entry[0] for command, entry in command_stats.items()},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    ))
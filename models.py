@@ -9,7 +9,7 @@ Priority-based single-category classification:
 Each step is classified into EXACTLY ONE category.
 """
 
-from enum import Enum
+from enum import IntEnum
 from typing import TypedDict, Optional, Dict, Any
 
 
@@ -17,25 +17,34 @@ from typing import TypedDict, Optional, Dict, Any
 # ENUMS - Type-Safe Constants (Priority Order)
 # ============================================================================
 
-class CacheFailureCategory(Enum):
+class CacheFailureCategory(IntEnum):
     """
     All possible cache failure categories in PRIORITY ORDER.
     
     Each step is classified into the FIRST matching category.
     Using Enum ensures type-safe classification.
+    
+    Members are small ints (cheap dict keys while aggregating); the
+    report key for each category is its label.
     """
-    UNDOABLE = "undoable"                                # Priority 0
-    UNBLOCKER_CALL = "unblocker_call"                    # Priority 1
-    OCR_STEPS = "ocr_steps"                              # Priority 2
-    DYNAMIC_STEP = "dynamic_step"
-    NULL_LLM_OUTPUT = "null_llm_output"
-    FAILED_STEP = "failed_step"                          # Priority 3
-    CACHE_READ_STATUS_NONE = "cache_read_status_none"    # Priority 4
-    NO_CACHE_DOCUMENTS_FOUND = "no_cache_documents_found"  # Priority 5
-    LESS_SIMILARITY_THRESHOLD = "less_similarity_threshold"  # Priority 6
-    FAILED_AT_MUST_MATCH_FILTER = "failed_at_cand_nos_after_must_match_filter"  # Priority 7
-    FAILED_AFTER_SIMILAR_DOC = "failed_after_similar_document_found_with_threshold_after_must_match_filter"  # Priority 8
-    UNCLASSIFIED = "unclassified"  # Priority 9 (catch-all)
+    def __new__(cls, value: int, label: str) -> "CacheFailureCategory":
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = label
+        return member
+    
+    UNDOABLE = 0, "undoable"                                # Priority 0
+    UNBLOCKER_CALL = 1, "unblocker_call"                    # Priority 1
+    OCR_STEPS = 2, "ocr_steps"                              # Priority 2
+    DYNAMIC_STEP = 3, "dynamic_step"
+    FAILED_STEP = 4, "failed_step"                          # Priority 3
+    NULL_LLM_OUTPUT = 5, "null_llm_output"                  # Priority 3.5
+    CACHE_READ_STATUS_NONE = 6, "cache_read_status_none"    # Priority 4
+    NO_CACHE_DOCUMENTS_FOUND = 7, "no_cache_documents_found"  # Priority 5
+    LESS_SIMILARITY_THRESHOLD = 8, "less_similarity_threshold"  # Priority 6
+    FAILED_AT_MUST_MATCH_FILTER = 9, "failed_at_cand_nos_after_must_match_filter"  # Priority 7
+    FAILED_AFTER_SIMILAR_DOC = 10, "failed_after_similar_document_found_with_threshold_after_must_match_filter"  # Priority 8
+    UNCLASSIFIED = 11, "unclassified"  # Priority 9 (catch-all)
 
 
 # ============================================================================
@@ -69,10 +78,20 @@ class ComponentSelectionReport(TypedDict):
     cand_nos_after_parent_deep_text_filter: Optional[int]
 
 
-class ReportCategory(TypedDict):
+class _ReportCategoryCounts(TypedDict):
     """
-    Type definition for each category in the report.
+    Fields every report category has.
     """
     percentage: str
     document_count: int
+
+
+class ReportCategory(_ReportCategoryCounts, total=False):
+    """
+    Type definition for each category in the report.
+    
+    A category carries exactly one of steps_list (steps inline) or
+    steps_file (name of the gzipped JSONL file the steps were streamed to).
+    """
     steps_list: list
+    steps_file: str
@@ -7,17 +7,42 @@ comprehensive diagnostic capabilities for debugging classification issues.
 Uses priority-based single-category classification.
 """
 
-import json
-from datetime import datetime
-from typing import Dict, List, Optional
-from collections import defaultdict
+import functools
+import gzip
+import logging
+import operator
+import os
+import random
+from multiprocessing import Pool
+from datetime import datetime, timedelta
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import Counter
 from pathlib import Path
 
-from dynamodb_scanner import scan_test_steps_with_pagination
+import orjson
+
+from dynamodb_scanner import scan_with_parallel_segments
 from classifier import classify_step
-from utils import convert_dynamodb_item_to_dict, is_within_date_range, logger
+from models import CacheFailureCategory
+from utils import convert_dynamodb_item_to_dict, parse_iso_timestamp, parse_date_as_ist_to_utc, logger
 from config import DEFAULT_OUTPUT_DIR, CACHE_READ_STATUS_FILTER
 
+# Parallel scan segments for the full-table scan
+# The scan is network-bound, so use several workers per CPU
+REPORT_SCAN_SEGMENTS: int = min(32, (os.cpu_count() or 1) * 4)
+
+# Processes for step conversion and classification (CPU-bound)
+REPORT_CLASSIFY_PROCESSES: int = os.cpu_count() or 1
+
+# Items per task sent to a classify process (amortizes pickling/IPC)
+REPORT_CLASSIFY_CHUNKSIZE: int = 256
+
+# Unclassified diagnostics kept per run (uniform reservoir sample)
+UNCLASSIFIED_SAMPLE_SIZE: int = 10000
+
+# Banner line around console diagnostics
+_SEPARATOR: str = "=" * 70
+
 
 # ============================================================================
 # MAIN REPORT GENERATION
@@ -33,10 +58,11 @@ def generate_cache_report(
     Generate comprehensive cache failure classification report with diagnostics.
     
     Process:
-    1. Scan all steps from DynamoDB (with pagination)
+    1. Scan all steps from DynamoDB (parallel segments, with pagination)
     2. Filter by date range and criteria
     3. Classify each step into EXACTLY ONE category (priority-based)
-    4. Track unclassified steps with diagnostics
+    4. Track unclassified steps with diagnostics (reservoir sample of
+       UNCLASSIFIED_SAMPLE_SIZE, so memory stays bounded)
     5. Calculate statistics (counts, percentages that sum to 100%)
     6. Build report structure
     7. Save report and diagnostic files
@@ -44,178 +70,385 @@ def generate_cache_report(
     Args:
         start_date: Start date in IST (optional)
         end_date: End date in IST (optional)
-        save_to_file: Whether to save report to JSON file
+        save_to_file: Whether to save report to JSON file. Steps are then
+            streamed to one gzipped JSONL file per category next to the
+            report and the report only references them ("steps_file")
         output_path: Custom output file path (optional)
         
     Returns:
         Dict containing the complete report
     """
     if start_date and end_date:
-        logger.info(f"Starting filtered report: {start_date} to {end_date}")
+        logger.info("Starting filtered report: %s to %s", start_date, end_date)
     else:
         logger.info("Starting full table scan (no date filter)")
     
-    categorized_steps: Dict[str, List[Dict]] = defaultdict(list)
+    # Each analysed step is stored once; categories hold indices into all_steps
+    # When saving, steps are streamed to per-category files instead
+    # Per-category buckets are lists indexed by the IntEnum value (no hashing)
+    all_steps: List[Dict] = []
+    categorized_steps: List[List[int]] = [[] for _ in CacheFailureCategory]
+    category_counts: List[int] = [0] * len(CacheFailureCategory)
+    # Bounded sample of unclassified diagnostics; unclassified_count is exact
     unclassified_diagnostics: List[Dict] = []
+    unclassified_count: int = 0
     total_rows_analysed: int = 0
     
-    # Scan and process steps
-    for item in scan_test_steps_with_pagination():
-        step_dict: Dict = convert_dynamodb_item_to_dict(item)
-        
-        if not should_analyze_step(step_dict, start_date, end_date):
-            continue
-        
-        total_rows_analysed += 1
-        
-        # Classify step into EXACTLY ONE category
-        categories, diagnosis = classify_step(item)
-        
-        # If unclassified, log detailed diagnosis
-        if diagnosis:
-            unclassified_diagnostics.append(diagnosis)
+    warnings_enabled: bool = logger.isEnabledFor(logging.WARNING)
+    progress_enabled: bool = logger.isEnabledFor(logging.INFO)
+    
+    # IST date range parsed once, as UTC epoch seconds
+    date_bounds: Optional[Tuple[float, float]] = build_date_bounds(start_date, end_date)
+    
+    file_path: Optional[Path] = None
+    sinks: List[IO[bytes]] = []
+    if save_to_file:
+        file_path = build_report_path(output_path, start_date or "all", end_date or "all")
+        sinks = open_category_sinks(file_path)
+    
+    try:
+        # Scan and process steps
+        # Segment workers fetch pages concurrently; classify processes convert,
+        # filter and classify them; this thread aggregates the results
+        # Classification, cache_read_status and (coarse) date filters run server-side
+        scan_items = scan_with_parallel_segments(
+            REPORT_SCAN_SEGMENTS,
+            cache_read_statuses=CACHE_READ_STATUS_FILTER,
+            created_at_range=build_created_at_scan_range(start_date, end_date)
+        )
+        for step_dict, categories, diagnosis in classify_scan_items(scan_items, date_bounds):
+            total_rows_analysed += 1
             
-            # Log to console
-            logger.warning("="*70)
-            logger.warning(f"UNCLASSIFIED STEP: {diagnosis['step_id']}")
-            logger.warning(f"Step Classification: {diagnosis['step_classification']}")
-            # logger.warning(f"Used Ensemble: {diagnosis['is_ensemble']}")
-            logger.warning(f"Cache Read Status: {diagnosis['cache_read_status']}")
-            logger.warning(f"Test Step Status: {diagnosis['test_step_status']}")
-            logger.warning(f"Has Cache Query Results: {diagnosis['has_cache_query_results']}")
-            logger.warning(f"Has OCR Output: {diagnosis['has_ocr_output']}")
-            logger.warning(f"Is Blocker: {diagnosis['is_blocker']}")
-            logger.warning("")
-            logger.warning("Category Check Results:")
-            for category_name, check_result in diagnosis['category_checks'].items():
-                status = "✅ PASSED" if check_result['passed'] else "❌ FAILED"
-                logger.warning(f"  {category_name}: {status}")
-                logger.warning(f"    Reason: {check_result['reason']}")
-            logger.warning("="*70)
-        
-        # Add step to its ONE category
-        # categories will only have ONE element due to priority-based classification
-        for category in categories:
-            categorized_steps[category].append(step_dict)
-        
-        # Log progress
-        if total_rows_analysed % 100 == 0:
-            logger.info(f"Processed {total_rows_analysed} steps...")
+            # If unclassified, log detailed diagnosis
+            if diagnosis:
+                unclassified_count += 1
+                if len(unclassified_diagnostics) < UNCLASSIFIED_SAMPLE_SIZE:
+                    unclassified_diagnostics.append(diagnosis)
+                else:
+                    sample_index: int = random.randrange(unclassified_count)
+                    if sample_index < UNCLASSIFIED_SAMPLE_SIZE:
+                        unclassified_diagnostics[sample_index] = diagnosis
+                
+                # Log to console (one record per step)
+                if warnings_enabled:
+                    logger.warning(format_unclassified_diagnosis(diagnosis))
+            
+            # Add step to its ONE category
+            # categories will only have ONE element due to priority-based classification
+            if sinks:
+                step_line: bytes = orjson.dumps(step_dict, option=orjson.OPT_APPEND_NEWLINE)
+                for category in categories:
+                    sinks[category].write(step_line)
+                    category_counts[category] += 1
+            else:
+                step_index: int = len(all_steps)
+                all_steps.append(step_dict)
+                for category in categories:
+                    categorized_steps[category].append(step_index)
+                    category_counts[category] += 1
+            
+            # Log progress (every 128 steps: a bit test instead of a modulo)
+            if progress_enabled and not total_rows_analysed & 0x7F:
+                logger.info("Processed %d steps...", total_rows_analysed)
+    finally:
+        for sink in sinks:
+            sink.close()
     
     # Summary of unclassified steps
-    unclassified_count = len(unclassified_diagnostics)
     if unclassified_count > 0:
         logger.warning("")
-        logger.warning("="*70)
-        logger.warning(f"UNCLASSIFIED SUMMARY: {unclassified_count} steps ({unclassified_count/total_rows_analysed*100:.2f}%)")
-        logger.warning("="*70)
+        logger.warning(_SEPARATOR)
+        logger.warning(
+            "UNCLASSIFIED SUMMARY: %d steps (%.2f%%)",
+            unclassified_count, unclassified_count / total_rows_analysed * 100
+        )
+        logger.warning(_SEPARATOR)
         
-        # Analyze common patterns
+        # Analyze common patterns (on the sample for very large runs)
         analyze_unclassified_patterns(unclassified_diagnostics)
     
-    logger.info(f"Analysis complete. Total steps: {total_rows_analysed}")
+    logger.info("Analysis complete. Total steps: %d", total_rows_analysed)
     
     # Build report
     report: Dict = build_report_structure(
         total_rows=total_rows_analysed,
+        category_counts=category_counts,
+        unclassified_count=unclassified_count,
+        all_steps=all_steps,
         categorized_steps=categorized_steps,
-        unclassified_diagnostics=unclassified_diagnostics
+        steps_files={
+            category: category_steps_path(file_path, category).name
+            for category in CacheFailureCategory
+        } if file_path else None
     )
     
     # Save to file
-    if save_to_file:
-        file_path: str = save_report_to_file(report, output_path, start_date or "all", end_date or "all")
-        logger.info(f"Report saved to: {file_path}")
+    if file_path:
+        save_report_to_file(report, str(file_path), start_date or "all", end_date or "all")
+        logger.info("Report saved to: %s", file_path)
         
         # Save separate diagnostic file for unclassified
         if unclassified_count > 0:
-            diagnostic_path = file_path.replace('.json', '_unclassified_diagnostics.json')
-            with open(diagnostic_path, 'w') as f:
-                json.dump(unclassified_diagnostics, f, indent=2)
-            logger.info(f"Unclassified diagnostics saved to: {diagnostic_path}")
+            diagnostic_path = file_path.with_name(f"{file_path.stem}_unclassified_diagnostics.json")
+            diagnostic_path.write_bytes(
+                orjson.dumps(
+                    {
+                        "total": unclassified_count,
+                        "sampled": len(unclassified_diagnostics),
+                        "diagnostics": unclassified_diagnostics
+                    },
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                )
+            )
+            logger.info("Unclassified diagnostics saved to: %s", diagnostic_path)
     
     return report
 
 
+# ============================================================================
+# PARALLEL CLASSIFICATION
+# ============================================================================
+
+def _classify_worker(
+    date_bounds: Optional[Tuple[float, float]],
+    item: Dict
+) -> Optional[Tuple[Dict, List[CacheFailureCategory], Optional[Dict]]]:
+    """
+    Convert, filter and classify one raw scan item (runs in a classify process).
+    
+    Returns:
+        (step_dict, categories, diagnosis), or None if the step is filtered out
+    """
+    step_dict: Dict = convert_dynamodb_item_to_dict(item)
+    
+    if not make_step_filter(date_bounds)(step_dict):
+        return None
+    
+    # Classify step into EXACTLY ONE category
+    categories, diagnosis = classify_step(step_dict)
+    return step_dict, categories, diagnosis
+
+
+def classify_scan_items(
+    scan_items: Iterable[Dict],
+    date_bounds: Optional[Tuple[float, float]]
+) -> Iterator[Tuple[Dict, List[CacheFailureCategory], Optional[Dict]]]:
+    """
+    Classify raw scan items on all cores.
+    
+    The pool's feeder thread drains scan_items while up to
+    REPORT_CLASSIFY_PROCESSES processes run _classify_worker() on chunks of
+    REPORT_CLASSIFY_CHUNKSIZE items, so classification is not limited by
+    the GIL. With a single process everything runs inline.
+    
+    Args:
+        scan_items: Raw DynamoDB items
+        date_bounds: Date bounds from build_date_bounds()
+        
+    Yields:
+        (step_dict, categories, diagnosis) for every step that passes
+        the make_step_filter() predicate, in no particular order
+    """
+    classify = functools.partial(_classify_worker, date_bounds)
+    
+    if REPORT_CLASSIFY_PROCESSES <= 1:
+        results = map(classify, scan_items)
+        yield from (result for result in results if result is not None)
+        return
+    
+    with Pool(processes=REPORT_CLASSIFY_PROCESSES) as pool:
+        results = pool.imap_unordered(classify, scan_items, chunksize=REPORT_CLASSIFY_CHUNKSIZE)
+        yield from (result for result in results if result is not None)
+
+
 # ============================================================================
 # PATTERN ANALYSIS
 # ============================================================================
 
+def format_unclassified_diagnosis(diagnosis: Dict) -> str:
+    """
+    Format the console block for one unclassified step.
+    
+    The block is returned as a single string so it is logged as one
+    record instead of one call per line.
+    """
+    lines: List[str] = [
+        _SEPARATOR,
+        f"UNCLASSIFIED STEP: {diagnosis['step_id']}",
+        f"Step Classification: {diagnosis['step_classification']}",
+        # f"Used Ensemble: {diagnosis['is_ensemble']}",
+        f"Cache Read Status: {diagnosis['cache_read_status']}",
+        f"Test Step Status: {diagnosis['test_step_status']}",
+        f"Has Cache Query Results: {diagnosis['has_cache_query_results']}",
+        f"Has OCR Output: {diagnosis['has_ocr_output']}",
+        f"Is Blocker: {diagnosis['is_blocker']}",
+        "",
+        "Category Check Results:"
+    ]
+    for category_name, check_result in diagnosis['category_checks'].items():
+        status = "✅ PASSED" if check_result['passed'] else "❌ FAILED"
+        lines.append(f"  {category_name}: {status}")
+        lines.append(f"    Reason: {check_result['reason']}")
+    lines.append(_SEPARATOR)
+    
+    return "\n".join(lines)
+
+
+
+# Boolean diagnostic fields counted by analyze_unclassified_patterns()
+_DIAGNOSTIC_FLAGS = ('has_cache_query_results', 'has_ocr_output', 'is_blocker')
+
+
 def analyze_unclassified_patterns(diagnostics: List[Dict]) -> None:
     """
     Analyze patterns in unclassified steps to find common characteristics.
     
     This helps identify missing classification categories or logic bugs.
+    Status groups are listed most common first.
     """
     logger.warning("\nPattern Analysis:")
     logger.warning("-" * 70)
     
-    # Group by various attributes
-    by_cache_status = defaultdict(int)
-    by_test_status = defaultdict(int)
-    has_query_results_count = 0
-    has_ocr_count = 0
-    is_blocker_count = 0
+    # Group by various attributes in a single pass over the diagnostics
+    by_cache_status = Counter()
+    by_test_status = Counter()
+    flag_counts = Counter()
     
     for diag in diagnostics:
         by_cache_status[diag['cache_read_status']] += 1
         by_test_status[diag['test_step_status']] += 1
-        if diag['has_cache_query_results']:
-            has_query_results_count += 1
-        if diag['has_ocr_output']:
-            has_ocr_count += 1
-        if diag['is_blocker']:
-            is_blocker_count += 1
+        flag_counts.update(flag for flag in _DIAGNOSTIC_FLAGS if diag[flag])
     
-    logger.warning(f"By cache_read_status:")
-    for status, count in sorted(by_cache_status.items()):
-        logger.warning(f"  {status}: {count} steps")
+    logger.warning("By cache_read_status:")
+    for status, count in by_cache_status.most_common():
+        logger.warning("  %s: %d steps", status, count)
     
-    logger.warning(f"\nBy test_step_status:")
-    for status, count in sorted(by_test_status.items()):
-        logger.warning(f"  {status}: {count} steps")
+    logger.warning("\nBy test_step_status:")
+    for status, count in by_test_status.most_common():
+        logger.warning("  %s: %d steps", status, count)
     
-    logger.warning(f"\nOther characteristics:")
-    logger.warning(f"  Has cache_query_results: {has_query_results_count}")
-    logger.warning(f"  Has OCR output: {has_ocr_count}")
-    logger.warning(f"  Is blocker: {is_blocker_count}")
+    logger.warning("\nOther characteristics:")
+    logger.warning("  Has cache_query_results: %d", flag_counts['has_cache_query_results'])
+    logger.warning("  Has OCR output: %d", flag_counts['has_ocr_output'])
+    logger.warning("  Is blocker: %d", flag_counts['is_blocker'])
 
 
 # ============================================================================
 # FILTERING LOGIC
 # ============================================================================
 
-def should_analyze_step(
-    step: Dict, 
-    start_date: Optional[str],
-    end_date: Optional[str]
-) -> bool:
+# Fields read by the step filter, fetched together
+_FILTER_FIELDS = operator.itemgetter('step_classification', 'cache_read_status', 'created_at')
+
+
+@functools.lru_cache(maxsize=8)
+def make_step_filter(
+    date_bounds: Optional[Tuple[float, float]]
+) -> Callable[[Dict], bool]:
     """
-    Determine if step should be included in analysis.
+    Build the predicate that decides if a step is included in analysis.
     
     Filters:
     1. step_classification must be 'TAP' or 'TEXT'
     2. cache_read_status must be -1, 0, or missing
     3. created_at must be within date range (if dates provided)
+    
+    Filters 1-2 and a widened date range are also applied server-side in
+    the scan; this remains the exact check.
+    
+    The allowed values are frozensets and the bounds are bound as closure
+    locals once; cached, so each classify process builds it once per range.
+    
+    Args:
+        date_bounds: Inclusive (start, end) UTC epoch seconds from
+            build_date_bounds(), or None for no date filter
+        
+    Returns:
+        predicate(step) -> bool for converted step dicts
     """
-    # Filter 1: Step classification
-    step_classification: Optional[str] = step.get('step_classification')
-    if step_classification not in ['TAP', 'TEXT']:
-        return False
+    valid_classifications = frozenset(('TAP', 'TEXT'))
+    valid_statuses = frozenset(CACHE_READ_STATUS_FILTER)
+    start_ts, end_ts = date_bounds or (None, None)
     
-    # Filter 2: Cache read status
-    cache_read_status: Optional[int] = step.get('cache_read_status')
-    if cache_read_status is not None and cache_read_status not in CACHE_READ_STATUS_FILTER:
-        return False
+    def should_analyze_step(step: Dict, _extract=_FILTER_FIELDS, _get=dict.get) -> bool:
+        # All three fields in one C call; a missing field falls back to .get()
+        try:
+            step_classification, cache_read_status, created_at = _extract(step)
+        except KeyError:
+            step_classification = _get(step, 'step_classification')
+            cache_read_status = _get(step, 'cache_read_status')
+            created_at = _get(step, 'created_at')
+        
+        # Filter 1: Step classification
+        if step_classification not in valid_classifications:
+            return False
+        
+        # Filter 2: Cache read status
+        if cache_read_status is not None and cache_read_status not in valid_statuses:
+            return False
+        
+        # Filter 3: Date range
+        if start_ts is not None:
+            if created_at:
+                try:
+                    created_ts: float = parse_iso_timestamp(created_at)
+                except ValueError as e:
+                    logger.error("Date comparison error for '%s': %s", created_at, e)
+                    return False
+                
+                if not start_ts <= created_ts <= end_ts:
+                    return False
+        
+        return True
     
-    # Filter 3: Date range
-    if start_date and end_date:
-        created_at: Optional[str] = step.get('created_at')
-        if created_at:
-            if not is_within_date_range(created_at, start_date, end_date):
-                return False
+    return should_analyze_step
+
+
+def build_date_bounds(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Optional[Tuple[float, float]]:
+    """
+    Parse the IST date range once for the per-step date filter.
+    
+    Same range as utils.is_within_date_range(): start of start_date to
+    end of end_date, both interpreted as IST.
     
-    return True
+    Returns:
+        Inclusive (start, end) UTC epoch seconds, or None when no date range is given
+    """
+    if not (start_date and end_date):
+        return None
+    
+    return (
+        parse_date_as_ist_to_utc(start_date, end_of_day=False).timestamp(),
+        parse_date_as_ist_to_utc(end_date, end_of_day=True).timestamp()
+    )
+
+
+def build_created_at_scan_range(
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Optional[Tuple[str, str]]:
+    """
+    Build coarse created_at bounds for the server-side scan filter.
+    
+    created_at is compared as a string by DynamoDB, so the IST range is
+    converted to UTC and widened to whole days with one day of margin on
+    each side. That keeps the filter correct for any stored UTC offset;
+    make_step_filter() still applies the exact range.
+    
+    Returns:
+        (start, end) UTC date strings, or None when no date range is given
+    """
+    if not (start_date and end_date):
+        return None
+    
+    start_utc = parse_date_as_ist_to_utc(start_date, end_of_day=False) - timedelta(days=1)
+    end_utc = parse_date_as_ist_to_utc(end_date, end_of_day=True) + timedelta(days=2)
+    
+    # "YYYY-MM-DD" sorts before every timestamp on that day
+    return start_utc.date().isoformat(), end_utc.date().isoformat()
 
 
 # ============================================================================
@@ -224,49 +457,52 @@ def should_analyze_step(
 
 def build_report_structure(
     total_rows: int,
-    categorized_steps: Dict[str, List[Dict]],
-    unclassified_diagnostics: List[Dict]
+    category_counts: List[int],
+    unclassified_count: int,
+    all_steps: Optional[List[Dict]] = None,
+    categorized_steps: Optional[List[List[int]]] = None,
+    steps_files: Optional[Dict[int, str]] = None
 ) -> Dict:
     """
     Build the final report structure with statistics.
     
     With priority-based classification, the sum of all counts
     will EXACTLY equal total_rows (100%).
-    """
-    report_data: Dict = {}
     
-    # Categories in PRIORITY ORDER (matches classifier.py)
-    category_names: List[str] = [
-        "undoable",
-        "unblocker_call",                    # Priority 1
-        "ocr_steps",                         # Priority 2
-        "dynamic_step",
-        "failed_step",                       # Priority 3
-        "null_llm_output",                   # Priority 3.5
-        "cache_read_status_none",            # Priority 4
-        "no_cache_documents_found",          # Priority 5
-        "less_similarity_threshold",         # Priority 6
-        "failed_at_cand_nos_after_must_match_filter",  # Priority 7
-        "failed_after_similar_document_found_with_threshold_after_must_match_filter",  # Priority 8
-        "unclassified"                       # Priority 9
-    ]
+    Each category lists its steps inline ("steps_list") or, when the steps
+    were streamed to disk, names its JSONL file ("steps_file").
     
-    # Build report for each category
-    for category in category_names:
-        steps: List[Dict] = categorized_steps.get(category, [])
-        count: int = len(steps)
-        percentage: float = (count / total_rows * 100) if total_rows > 0 else 0.0
-        
-        report_data[category] = {
-            "percentage": f"{percentage:.2f}%",
-            "document_count": count,
-            "steps_list": steps
+    Args:
+        total_rows: Number of analysed steps
+        category_counts: Number of steps, indexed by CacheFailureCategory
+        unclassified_count: Number of unclassified steps
+        all_steps: Every analysed step dict, stored once (in-memory mode)
+        categorized_steps: Indices into all_steps, indexed by CacheFailureCategory
+        steps_files: int(CacheFailureCategory) -> steps file name (streamed mode)
+    """
+    # One divide for all categories
+    percent_per_row: float = (100.0 / total_rows) if total_rows > 0 else 0.0
+    
+    # Categories in PRIORITY ORDER (enum order matches classifier.py)
+    report_data: Dict = {}
+    for category in CacheFailureCategory:
+        count: int = category_counts[category]
+        category_data: Dict = {
+            "percentage": f"{count * percent_per_row:.2f}%",
+            "document_count": count
         }
+        
+        if steps_files is not None:
+            category_data["steps_file"] = steps_files[category]
+        else:
+            category_data["steps_list"] = [all_steps[index] for index in categorized_steps[category]]
+        
+        report_data[category.label] = category_data
     
     return {
         "total_rows_analysed": total_rows,
-        "unclassified_count": len(unclassified_diagnostics),
-        "unclassified_percentage": f"{(len(unclassified_diagnostics)/total_rows*100):.2f}%" if total_rows > 0 else "0.00%",
+        "unclassified_count": unclassified_count,
+        "unclassified_percentage": f"{unclassified_count * percent_per_row:.2f}%",
         "report": report_data
     }
 
@@ -275,41 +511,75 @@ def build_report_structure(
 # FILE OPERATIONS
 # ============================================================================
 
-def save_report_to_file(
-    report: Dict,
+def build_report_path(
     output_path: Optional[str],
     start_date: str,
     end_date: str
-) -> str:
-    """Save report to JSON file."""
+) -> Path:
+    """Resolve the report file path (timestamped name in DEFAULT_OUTPUT_DIR by default)."""
     output_dir: Path = Path(DEFAULT_OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    if not output_path:
-        timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if start_date == "all" or end_date == "all":
-            filename: str = f"cache_report_full_scan_{timestamp}.json"
-        else:
-            start_simple: str = start_date.split('T')[0]
-            end_simple: str = end_date.split('T')[0]
-            filename: str = f"cache_report_{start_simple}_to_{end_simple}_{timestamp}.json"
-        
-        output_path = str(output_dir / filename)
+    if output_path:
+        return Path(output_path)
+    
+    timestamp: str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    if start_date == "all" or end_date == "all":
+        filename: str = f"cache_report_full_scan_{timestamp}.json"
+    else:
+        start_simple: str = start_date.split('T')[0]
+        end_simple: str = end_date.split('T')[0]
+        filename: str = f"cache_report_{start_simple}_to_{end_simple}_{timestamp}.json"
+    
+    return output_dir / filename
+
+
+def category_steps_path(report_path: Path, category: CacheFailureCategory) -> Path:
+    """Path of the gzipped JSONL steps file for one category, next to the report."""
+    return report_path.with_name(f"{report_path.stem}_{category.label}.jsonl.gz")
+
+
+def open_category_sinks(report_path: Path) -> List[IO[bytes]]:
+    """
+    Open one gzipped JSONL steps file per category for streaming writes.
+    
+    Returns:
+        Binary gzip file objects indexed by CacheFailureCategory (caller closes)
+    """
+    sinks: List[IO[bytes]] = []
+    try:
+        for category in CacheFailureCategory:
+            sinks.append(gzip.open(category_steps_path(report_path, category), 'wb'))
+    except OSError:
+        for sink in sinks:
+            sink.close()
+        raise
+    return sinks
+
+
+def save_report_to_file(
+    report: Dict,
+    output_path: Optional[str],
+    start_date: str,
+    end_date: str
+) -> str:
+    """Save report to JSON file (UTF-8, 2-space indent)."""
+    output_path = str(build_report_path(output_path, start_date, end_date))
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    # orjson writes UTF-8 bytes directly (no intermediate str)
+    Path(output_path).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
-    logger.info(f"Report written to: {output_path}")
+    logger.info("Report written to: %s", output_path)
     
     return output_path
 
 
 def print_report_summary(report: Dict) -> None:
     """Print human-readable summary of report to console."""
-    print("\n" + "="*70)
+    print("\n" + _SEPARATOR)
     print("CACHE FAILURE CLASSIFICATION REPORT - SUMMARY")
-    print("="*70)
+    print(_SEPARATOR)
     print(f"Total Rows Analysed: {report['total_rows_analysed']}")
     print("\nCategory Breakdown (Priority Order):")
     print("-"*70)
@@ -343,6 +613,6 @@ def print_report_summary(report: Dict) -> None:
             print(f"  Percentage: {percentage:>8}")
             print()
     
-    print("="*70)
+    print(_SEPARATOR)
     print(f"Note: With priority-based classification, percentages sum to 100.00%")
-    print("="*70)
+    print(_SEPARATOR)
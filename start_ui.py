@@ -4,94 +4,112 @@ Startup script for the Cache Failure Classification System UI
 
 This script starts both the Flask API server and the React development server.
 It provides a unified way to launch the entire UI system.
+
+Both servers run as asyncio subprocesses: a single event loop relays their
+output and notices when either of them exits.
 """
 
+import asyncio
 import os
-import sys
-import subprocess
-import time
+import shutil
 import signal
-import threading
+import sys
 from pathlib import Path
 
-def run_command(command, cwd=None, shell=True):
-    """Run a command and return the process"""
-    print(f"Running: {command}")
+# Bytes read from a server's output per read
+OUTPUT_CHUNK_SIZE = 65536
+
+# Process groups (start_new_session/killpg) are POSIX-only
+USE_PROCESS_GROUPS = os.name == "posix"
+
+async def run_command(*command, cwd=None):
+    """Start a command (no shell) and return the asyncio process"""
+    print(f"Running: {' '.join(command)}")
     if cwd:
         print(f"Working directory: {cwd}")
     
-    process = subprocess.Popen(
-        command,
+    process = await asyncio.create_subprocess_exec(
+        *command,
         cwd=cwd,
-        shell=shell,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True,
-        bufsize=1
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        start_new_session=USE_PROCESS_GROUPS  # Own process group, so children can be stopped too
     )
     
     return process
 
-def monitor_process(process, name):
-    """Monitor a process and print its output"""
+async def stream_output(stream, name):
+    """Print a process's output (read in large chunks, printed per line)"""
     print(f"\n=== {name} Output ===")
+    pending = b''
     try:
-        for line in iter(process.stdout.readline, ''):
-            if line:
-                print(f"[{name}] {line.strip()}")
+        while data := await stream.read(OUTPUT_CHUNK_SIZE):
+            *lines, pending = (pending + data).split(b'\n')
+            for line in lines:
+                print(f"[{name}] {line.decode(errors='replace').strip()}")
+        
+        if pending:
+            print(f"[{name}] {pending.decode(errors='replace').strip()}")
     except Exception as e:
         print(f"Error monitoring {name}: {e}")
 
-def main():
-    """Main function to start both servers"""
-    project_root = Path(__file__).parent.absolute()
-    ui_dir = project_root / "ui"
-    
-    print("🚀 Starting Cache Failure Classification System UI")
-    print("=" * 60)
-    
-    # Check if UI directory exists
-    if not ui_dir.exists():
-        print("❌ UI directory not found. Please run the setup first.")
-        sys.exit(1)
-    
-    # Check if node_modules exists
-    node_modules = ui_dir / "node_modules"
-    if not node_modules.exists():
-        print("❌ Node modules not found. Please run 'npm install' in the ui directory first.")
-        sys.exit(1)
+async def wait_for_exit(process, name):
+    """Wait until a process exits and report it"""
+    return_code = await process.wait()
+    print(f"\n❌ {name} has stopped unexpectedly")
+    print(f"Return code: {return_code}")
+
+async def stop_process(process, name):
+    """
+    Terminate a process, killing it if it does not stop within 5 seconds.
     
+    On POSIX the whole process group is signalled, so children (npm
+    spawns the dev server) stop too.
+    """
+    print(f"🛑 Stopping {name}...")
+    try:
+        if USE_PROCESS_GROUPS:
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        print(f"⚠️  Force killing {name}...")
+        try:
+            if USE_PROCESS_GROUPS:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+    except ProcessLookupError:  # Process (group) already gone
+        pass
+    except Exception as e:
+        print(f"Error stopping {name}: {e}")
+
+async def main_async(project_root, ui_dir):
+    """Start both servers and run until one of them exits or Ctrl+C"""
     processes = []
+    output_tasks = []
+    exit_tasks = []
     
     try:
         # Start Flask API server
         print("\n📡 Starting Flask API server...")
-        api_process = run_command("python api_server.py", cwd=project_root)
+        api_process = await run_command("python", "api_server.py", cwd=project_root)
         processes.append(("API Server", api_process))
+        output_tasks.append(asyncio.create_task(stream_output(api_process.stdout, "API")))
         
-        # Start API server monitoring thread
-        api_thread = threading.Thread(
-            target=monitor_process, 
-            args=(api_process, "API")
-        )
-        api_thread.daemon = True
-        api_thread.start()
-        
-        # Wait a moment for API server to start
-        time.sleep(3)
+        # Wait a moment for API server to start (its output keeps streaming)
+        await asyncio.sleep(3)
         
         # Start React development server
         print("\n⚛️  Starting React development server...")
-        react_process = run_command("npm start", cwd=ui_dir)
+        # npm is npm.cmd on Windows, which exec (no shell) only finds via which()
+        react_process = await run_command(shutil.which("npm") or "npm", "start", cwd=ui_dir)
         processes.append(("React App", react_process))
-        
-        # Start React monitoring thread
-        react_thread = threading.Thread(
-            target=monitor_process, 
-            args=(react_process, "React")
-        )
-        react_thread.daemon = True
-        react_thread.start()
+        output_tasks.append(asyncio.create_task(stream_output(react_process.stdout, "React")))
         
         print("\n" + "=" * 60)
         print("🎉 Both servers are starting up!")
@@ -102,22 +120,13 @@ def main():
         print("Press Ctrl+C to stop both servers")
         print("=" * 60)
         
-        # Wait for processes
-        while True:
-            time.sleep(1)
-            
-            # Check if any process has died
-            for name, process in processes:
-                if process.poll() is not None:
-                    print(f"\n❌ {name} has stopped unexpectedly")
-                    return_code = process.returncode
-                    print(f"Return code: {return_code}")
-                    break
-            else:
-                continue
-            break
+        # Wait for processes: the first one to exit ends the session
+        for name, process in processes:
+            exit_tasks.append(asyncio.create_task(wait_for_exit(process, name)))
+        await asyncio.wait(exit_tasks, return_when=asyncio.FIRST_COMPLETED)
     
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
+        # asyncio.run() cancels this task on Ctrl+C
         print("\n\n🛑 Shutting down servers...")
     
     except Exception as e:
@@ -125,19 +134,44 @@ def main():
     
     finally:
         # Clean up processes
-        for name, process in processes:
-            if process.poll() is None:  # Process is still running
-                print(f"🛑 Stopping {name}...")
-                try:
-                    process.terminate()
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print(f"⚠️  Force killing {name}...")
-                    process.kill()
-                except Exception as e:
-                    print(f"Error stopping {name}: {e}")
+        for task in exit_tasks:
+            task.cancel()
+        await asyncio.gather(*(stop_process(process, name) for name, process in processes))
+        
+        # Output readers end at EOF once the processes are gone; without
+        # process groups a leftover child can hold the pipe open, so bound it
+        if output_tasks:
+            _, still_reading = await asyncio.wait(output_tasks, timeout=2)
+            for task in still_reading:
+                task.cancel()
+            await asyncio.gather(*output_tasks, return_exceptions=True)
         
         print("✅ All servers stopped")
 
+def main():
+    """Main function to start both servers"""
+    project_root = Path(__file__).parent.absolute()
+    ui_dir = project_root / "ui"
+    
+    print("🚀 Starting Cache Failure Classification System UI")
+    print("=" * 60)
+    
+    # Check if UI directory exists
+    if not ui_dir.exists():
+        print("❌ UI directory not found. Please run the setup first.")
+        sys.exit(1)
+    
+    # Check if node_modules exists
+    node_modules = ui_dir / "node_modules"
+    if not node_modules.exists():
+        print("❌ Node modules not found. Please run 'npm install' in the ui directory first.")
+        sys.exit(1)
+    
+    try:
+        asyncio.run(main_async(project_root, ui_dir))
+    except KeyboardInterrupt:
+        # Shutdown already ran inside main_async
+        pass
+
 if __name__ == "__main__":
     main()
@@ -5,10 +5,21 @@ This module contains reusable helper functions with proper timezone handling.
 All DynamoDB timestamps are in UTC and are properly converted to IST for filtering.
 """
 
-import json
+import functools
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional, Union
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
+
+import orjson
+
+# Optional compiled timestamp parsers (build with: cythonize -i utils_fast.pyx);
+# each returns None for input it does not handle, falling back to Python below
+try:
+    from utils_fast import parse_iso_utc as _parse_iso_utc_fast
+    from utils_fast import parse_iso_utc_timestamp as _parse_iso_timestamp_fast
+except ImportError:
+    _parse_iso_utc_fast = None
+    _parse_iso_timestamp_fast = None
 
 # ============================================================================
 # LOGGING SETUP
@@ -29,11 +40,38 @@ logger = logging.getLogger(__name__)
 # IST is UTC + 5:30
 IST_OFFSET = timedelta(hours=5, minutes=30)
 
+# Shared UTC tzinfo (module-level lookup instead of timezone.utc attribute access)
+_UTC = timezone.utc
+
+# Proleptic ordinal of 1970-01-01 (day 0 of POSIX timestamps)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Per-row date comparison debug output (kept out of the hot path)
+_DEBUG_DATES = False
+
+# Errors from parsing a malformed or non-string timestamp; anything else propagates
+_DATE_ERRORS = (ValueError, TypeError, AttributeError)
+
 
 # ============================================================================
 # DYNAMODB DATA CONVERSION
 # ============================================================================
 
+def _convert_number(number_str: str) -> Union[int, float]:
+    """Convert a DynamoDB N value, keeping integers as int."""
+    return float(number_str) if '.' in number_str else int(number_str)
+
+
+# Dispatch table for the scalar attribute types that appear in TestSteps
+# (M and L are expanded by convert_dynamodb_item_to_dict itself)
+_DYNAMODB_TYPE_CONVERTERS = {
+    'S': str,
+    'N': _convert_number,
+    'BOOL': bool,
+    'NULL': lambda _: None,
+}
+
+
 def convert_dynamodb_item_to_dict(item: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert DynamoDB JSON format to regular Python dictionary.
@@ -43,39 +81,42 @@ def convert_dynamodb_item_to_dict(item: Dict[str, Any]) -> Dict[str, Any]:
         {"field_name": {"N": "123"}}            # Number
         {"field_name": {"BOOL": true}}          # Boolean
     
+    Scalars (S/N/BOOL/NULL) are unwrapped with a single lookup in a type
+    dispatch table. Unknown types and values that are not in DynamoDB
+    format are kept as-is. Numbers stay int/float (boto3's
+    TypeDeserializer would return Decimal, which orjson cannot serialize).
+    
+    Nested maps (M) and lists (L) are expanded iteratively: each gets an
+    empty output container in place (preserving key order) and is queued
+    on a worklist of (source pairs, target container), so nesting depth
+    costs no Python call frames and cannot hit the recursion limit.
+    
     Args:
         item: DynamoDB item in native format
         
     Returns:
         Regular Python dictionary with actual values
     """
+    converters_get = _DYNAMODB_TYPE_CONVERTERS.get
     result = {}
+    pending = [(item.items(), result)]
     
-    for key, value in item.items():
-        if isinstance(value, dict):
-            if 'S' in value:
-                result[key] = value['S']
-            elif 'N' in value:
-                number_str = value['N']
-                if '.' in number_str:
-                    result[key] = float(number_str)
-                else:
-                    result[key] = int(number_str)
-            elif 'BOOL' in value:
-                result[key] = value['BOOL']
-            elif 'NULL' in value:
-                result[key] = None
-            elif 'M' in value:
-                result[key] = convert_dynamodb_item_to_dict(value['M'])
-            elif 'L' in value:
-                result[key] = [
-                    convert_dynamodb_item_to_dict({'item': v})['item'] 
-                    for v in value['L']
-                ]
-            else:
-                result[key] = value
-        else:
-            result[key] = value
+    while pending:
+        pairs, target = pending.pop()
+        for key, value in pairs:
+            if type(value) is dict and len(value) == 1:
+                for type_tag, raw_value in value.items():
+                    converter = converters_get(type_tag)
+                    if converter is not None:
+                        value = converter(raw_value)
+                    elif type_tag == 'M':
+                        value = {}
+                        pending.append((raw_value.items(), value))
+                    elif type_tag == 'L':
+                        value = [None] * len(raw_value)
+                        pending.append((enumerate(raw_value), value))
+            # dict key or list index (lists are pre-sized)
+            target[key] = value
     
     return result
 
@@ -98,9 +139,9 @@ def parse_json_string(json_str: Optional[str]) -> Optional[Any]:
         return None
     
     try:
-        return json.loads(json_str)
-    except (json.JSONDecodeError, TypeError) as e:
-        logger.warning(f"Failed to parse JSON: {str(e)[:100]}")
+        return orjson.loads(json_str)
+    except (orjson.JSONDecodeError, TypeError) as e:
+        logger.warning("Failed to parse JSON: %.100s", e)
         return None
 
 
@@ -120,6 +161,21 @@ def get_nested_value(data: Dict, *keys: str, default: Any = None) -> Any:
     Returns:
         Value at nested location or default if not found
     """
+    # Unrolled fast paths for the common 2- and 3-key lookups
+    # (a non-dict level raises TypeError for string keys)
+    if len(keys) == 2:
+        key1, key2 = keys
+        try:
+            return data[key1][key2]
+        except (KeyError, TypeError):
+            return default
+    if len(keys) == 3:
+        key1, key2, key3 = keys
+        try:
+            return data[key1][key2][key3]
+        except (KeyError, TypeError):
+            return default
+    
     result = data
     for key in keys:
         if isinstance(result, dict) and key in result:
@@ -133,6 +189,24 @@ def get_nested_value(data: Dict, *keys: str, default: Any = None) -> Any:
 # DATE/TIME PARSING WITH PROPER TIMEZONE HANDLING
 # ============================================================================
 
+def _is_dynamodb_timestamp(date_str: str) -> bool:
+    """
+    Check for the exact DynamoDB shape "YYYY-MM-DDTHH:MM:SS[.ffffff]+0000".
+    
+    Only the separators are checked (as in utils_fast._read_fields); the
+    digit fields are validated by int() and datetime/date. Anything else,
+    e.g. a ',' fraction separator, goes through fromisoformat instead.
+    """
+    length = len(date_str)
+    return (
+        (length == 24 or (length == 31 and date_str[19] == '.'))
+        and date_str.endswith('+0000')
+        and date_str[10] == 'T'
+        and date_str[4] == '-' and date_str[7] == '-'
+        and date_str[13] == ':' and date_str[16] == ':'
+    )
+
+
 def parse_iso_datetime(date_str: str) -> datetime:
     """
     Parse ISO datetime string to timezone-aware UTC datetime.
@@ -166,8 +240,25 @@ def parse_iso_datetime(date_str: str) -> datetime:
         2025-10-08 10:00:00+00:00
     """
     try:
+        # Compiled fast path (utils_fast) when built
+        if _parse_iso_utc_fast is not None:
+            dt = _parse_iso_utc_fast(date_str)
+            if dt is not None:
+                return dt
+        
+        # Fast path: the fixed DynamoDB shape "YYYY-MM-DDTHH:MM:SS[.ffffff]+0000"
+        # is built directly from its digits, skipping the checks below
+        if _is_dynamodb_timestamp(date_str):
+            return datetime(
+                int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]),
+                int(date_str[20:26]) if len(date_str) == 31 else 0,
+                tzinfo=_UTC
+            )
+        
         # Case 1: Has timezone offset (+0000, +0530, etc.)
-        if '+' in date_str or '-' in date_str.split('T')[-1]:
+        # (a '-' after the last 'T'; rfind is -1 without a 'T', checking the whole string)
+        if '+' in date_str or '-' in date_str[date_str.rfind('T') + 1:]:
             # Python's fromisoformat handles this directly
             dt = datetime.fromisoformat(date_str)
             
@@ -196,10 +287,46 @@ def parse_iso_datetime(date_str: str) -> datetime:
             return dt.replace(tzinfo=timezone.utc)
     
     except ValueError as e:
-        logger.error(f"Failed to parse date: {date_str}")
+        logger.error("Failed to parse date: %s", date_str)
         raise ValueError(f"Invalid date format: {date_str}") from e
 
 
+def parse_iso_timestamp(date_str: str) -> float:
+    """
+    Parse ISO datetime string to UTC POSIX seconds.
+    
+    Same result as parse_iso_datetime(date_str).timestamp(), for comparing
+    against precomputed epoch bounds. The DynamoDB "+0000" shape is
+    computed directly from its digits without building a datetime; other
+    formats go through parse_iso_datetime().
+    
+    Args:
+        date_str: ISO format datetime string
+        
+    Returns:
+        Seconds since the Unix epoch (float, microsecond precision)
+        
+    Raises:
+        ValueError: If string cannot be parsed
+    """
+    # Compiled fast path (utils_fast) when built
+    if _parse_iso_timestamp_fast is not None:
+        timestamp = _parse_iso_timestamp_fast(date_str)
+        if timestamp is not None:
+            return timestamp
+    
+    if _is_dynamodb_timestamp(date_str):
+        hour, minute, second = int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19])
+        if hour < 24 and minute < 60 and second < 60:
+            # date() validates the calendar fields; the integer microsecond
+            # total is divided once, rounding exactly like timestamp()
+            days = date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])).toordinal() - _EPOCH_ORDINAL
+            microseconds = int(date_str[20:26]) if len(date_str) == 31 else 0
+            return ((days * 86400 + hour * 3600 + minute * 60 + second) * 1_000_000 + microseconds) / 1_000_000
+    
+    return parse_iso_datetime(date_str).timestamp()
+
+
 def convert_ist_to_utc(ist_datetime: datetime) -> datetime:
     """
     Convert IST datetime to UTC datetime.
@@ -208,7 +335,7 @@ def convert_ist_to_utc(ist_datetime: datetime) -> datetime:
     To convert IST to UTC: subtract 5:30
     
     Args:
-        ist_datetime: datetime in IST (can be naive or aware)
+        ist_datetime: datetime in IST (naive), or aware in any timezone
         
     Returns:
         timezone-aware datetime in UTC
@@ -221,14 +348,16 @@ def convert_ist_to_utc(ist_datetime: datetime) -> datetime:
         2025-10-08 04:30:00+00:00  # Oct 8, 4:30 AM UTC
     """
     # If naive, treat as IST
+    # (subtract + replace measures faster than replace(tzinfo=IST).astimezone)
     if ist_datetime.tzinfo is None:
         utc_dt = ist_datetime - IST_OFFSET
-        return utc_dt.replace(tzinfo=timezone.utc)
+        return utc_dt.replace(tzinfo=_UTC)
     
-    # If already aware, convert to UTC
-    return ist_datetime.astimezone(timezone.utc) - IST_OFFSET
+    # If already aware, its own offset applies: just convert to UTC
+    return ist_datetime.astimezone(_UTC)
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_date_as_ist_to_utc(date_str: str, end_of_day: bool = False) -> datetime:
     """
     Parse date string as IST and convert to UTC.
@@ -242,6 +371,9 @@ def parse_date_as_ist_to_utc(date_str: str, end_of_day: bool = False) -> datetim
         
     Returns:
         timezone-aware datetime in UTC
+    
+    Results are memoized per (date_str, end_of_day): user date bounds
+    repeat across requests and rows.
         
     Example:
         >>> # User inputs: "2025-10-08" (meaning Oct 8 in IST)
@@ -253,18 +385,27 @@ def parse_date_as_ist_to_utc(date_str: str, end_of_day: bool = False) -> datetim
         >>> print(end_utc)
         2025-10-08 18:29:59+00:00  # Oct 8, 6:29 PM UTC (Oct 8, 11:59 PM IST)
     """
-    # Parse the input date (treat as IST)
-    parsed_dt = datetime.fromisoformat(date_str.split('+')[0].replace('Z', ''))
-    
-    # If date only (no time component) and end_of_day requested
-    if 'T' not in date_str and end_of_day:
-        # Set to 23:59:59 IST
-        parsed_dt = parsed_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-    
-    # Convert IST to UTC
-    utc_dt = convert_ist_to_utc(parsed_dt)
+    # Fast path: plain "YYYY-MM-DD" is built directly as UTC midnight or
+    # end of day, shifted by the IST offset (one construction, no replace)
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        year, month, day = int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+        if end_of_day:
+            utc_dt = datetime(year, month, day, 23, 59, 59, 999999, tzinfo=_UTC) - IST_OFFSET
+        else:
+            utc_dt = datetime(year, month, day, tzinfo=_UTC) - IST_OFFSET
+    else:
+        # Parse the input date (treat as IST)
+        parsed_dt = datetime.fromisoformat(date_str.split('+')[0].replace('Z', ''))
+        
+        # If date only (no time component) and end_of_day requested
+        if 'T' not in date_str and end_of_day:
+            # Set to 23:59:59 IST
+            parsed_dt = parsed_dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        
+        # Convert IST to UTC
+        utc_dt = convert_ist_to_utc(parsed_dt)
     
-    logger.debug(f"Parsed '{date_str}' as IST → UTC: {utc_dt}")
+    logger.debug("Parsed '%s' as IST → UTC: %s", date_str, utc_dt)
     
     return utc_dt
 
@@ -317,8 +458,8 @@ def is_within_date_range(
         # Compare in UTC (all timezone-aware)
         result = start_dt_utc <= created_dt_utc <= end_dt_utc
         
-        # Debug logging
-        if logger.isEnabledFor(logging.DEBUG):
+        # Debug logging (off unless _DEBUG_DATES is switched on by hand)
+        if _DEBUG_DATES:
             logger.debug(
                 f"Date comparison:\n"
                 f"  Created (UTC):  {created_dt_utc}\n"
@@ -329,6 +470,87 @@ def is_within_date_range(
         
         return result
     
-    except Exception as e:
-        logger.error(f"Date comparison error for '{created_at}': {e}")
+    except _DATE_ERRORS as e:
+        logger.error("Date comparison error for '%s': %s", created_at, e)
         return False
+
+
+def filter_within_date_range(
+    rows: Iterable[Dict],
+    start_date: str,
+    end_date: str,
+    key: str = 'created_at'
+) -> List[Dict]:
+    """
+    Keep the rows whose timestamp (UTC) falls within an IST date range.
+    
+    Batch form of is_within_date_range(): start_date and end_date are
+    parsed once for all rows into epoch seconds, so each row only parses
+    its own timestamp (parse_iso_timestamp) and compares floats.
+    Rows without a parseable timestamp are dropped.
+    
+    Args:
+        rows: Converted rows (regular Python dicts)
+        start_date: Start date in IST (user input)
+        end_date: End date in IST (user input)
+        key: Row field holding the ISO datetime string in UTC
+        
+    Returns:
+        List of the rows within range, in input order
+        
+    Example:
+        >>> rows = [{"created_at": "2025-10-08T10:00:00+0000"}, {"created_at": "2025-10-09T10:00:00+0000"}]
+        >>> filter_within_date_range(rows, "2025-10-08", "2025-10-08")
+        [{'created_at': '2025-10-08T10:00:00+0000'}]
+    """
+    # Bounds as epoch seconds: each row is a float compare, not a datetime compare
+    start_ts = parse_date_as_ist_to_utc(start_date, end_of_day=False).timestamp()
+    end_ts = parse_date_as_ist_to_utc(end_date, end_of_day=True).timestamp()
+    
+    within_range = []
+    for row in rows:
+        created_at = row.get(key)
+        if not created_at:
+            continue
+        
+        try:
+            if start_ts <= parse_iso_timestamp(created_at) <= end_ts:
+                within_range.append(row)
+        except _DATE_ERRORS as e:
+            logger.error("Date comparison error for '%s': %s", created_at, e)
+    
+    return within_range
+
+
+def filter_within_date_range_np(
+    created_at: Sequence[Optional[str]],
+    start_date: str,
+    end_date: str
+) -> "numpy.ndarray":
+    """
+    Vectorized date-range mask for a whole column of timestamps.
+    
+    The column is parsed and compared by pandas in C, so large batches
+    avoid the per-row Python loop of filter_within_date_range().
+    Missing or unparseable timestamps are outside the range.
+    
+    Requires the optional pandas dependency (imported on first use):
+        pip install "pandas>=2.0"
+    
+    Args:
+        created_at: ISO datetime strings in UTC (list or pandas Series)
+        start_date: Start date in IST (user input)
+        end_date: End date in IST (user input)
+        
+    Returns:
+        numpy bool array, True where the timestamp is within range
+    """
+    import pandas as pd
+    
+    start_dt_utc = parse_date_as_ist_to_utc(start_date, end_of_day=False)
+    end_dt_utc = parse_date_as_ist_to_utc(end_date, end_of_day=True)
+    
+    timestamps = pd.to_datetime(pd.Series(created_at), utc=True, format='mixed', errors='coerce')
+    
+    # NaT compares False, so bad rows drop out of the mask
+    return ((timestamps >= start_dt_utc) & (timestamps <= end_dt_utc)).to_numpy()
@@ -0,0 +1,160 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled fast paths for utils.py timestamp parsing (optional)
+
+Parses the fixed DynamoDB timestamp shape
+"YYYY-MM-DDTHH:MM:SS[.ffffff]+0000" with C integer arithmetic instead of
+Python-level slicing and int() calls. Anything else returns None, and
+utils.py falls back to its pure-Python parsing (which also raises the
+errors for malformed input).
+
+Build in place (needs Cython and a C compiler):
+    pip install "cython>=3.0"
+    cythonize -i utils_fast.pyx
+
+utils.py imports this module when the build is present and works
+unchanged without it.
+"""
+
+from cpython.datetime cimport import_datetime, datetime_new
+
+from datetime import timezone
+
+import_datetime()
+
+cdef object _UTC = timezone.utc
+
+# Largest microsecond total that converts to a double exactly (2**53)
+cdef long long _MAX_EXACT_MICROSECONDS = 9007199254740992
+
+
+# ============================================================================
+# FIELD PARSING
+# ============================================================================
+
+cdef inline int _read_digits(str s, Py_ssize_t start, Py_ssize_t count) noexcept:
+    """Read count ASCII digits from s[start:], or -1 if any is not a digit."""
+    cdef int value = 0
+    cdef Py_ssize_t i
+    cdef int digit
+    for i in range(start, start + count):
+        digit = <int>(<Py_UCS4>s[i]) - 48  # ord('0')
+        if digit < 0 or digit > 9:
+            return -1
+        value = value * 10 + digit
+    return value
+
+
+cdef bint _read_fields(str s, int* fields) noexcept:
+    """
+    Fill fields with (year, month, day, hour, minute, second, microsecond).
+
+    Returns False if s is not exactly the DynamoDB "+0000" shape.
+    """
+    cdef Py_ssize_t length = len(s)
+    cdef int i
+
+    if length != 24 and length != 31:
+        return False
+    if (s[4] != u'-' or s[7] != u'-' or s[10] != u'T' or s[13] != u':'
+            or s[16] != u':' or s[length - 5] != u'+'
+            or _read_digits(s, length - 4, 4) != 0):
+        return False
+
+    fields[0] = _read_digits(s, 0, 4)
+    fields[1] = _read_digits(s, 5, 2)
+    fields[2] = _read_digits(s, 8, 2)
+    fields[3] = _read_digits(s, 11, 2)
+    fields[4] = _read_digits(s, 14, 2)
+    fields[5] = _read_digits(s, 17, 2)
+    fields[6] = 0
+    if length == 31:
+        if s[19] != u'.':
+            return False
+        fields[6] = _read_digits(s, 20, 6)
+
+    for i in range(7):
+        if fields[i] < 0:
+            return False
+    return True
+
+
+cdef inline long long _days_from_civil(int year, int month, int day) noexcept:
+    """Days since 1970-01-01 for a proleptic Gregorian date (year >= 1)."""
+    cdef int y = year - (1 if month <= 2 else 0)
+    cdef int era = y // 400
+    cdef int year_of_era = y - era * 400
+    cdef int day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5 + day - 1
+    cdef int day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return <long long>era * 146097 + day_of_era - 719468
+
+
+cdef inline bint _is_valid_date(int year, int month, int day) noexcept:
+    """Calendar check matching datetime's (MINYEAR 1, leap years)."""
+    cdef int month_days
+    if year < 1 or month < 1 or month > 12 or day < 1:
+        return False
+    if month == 2:
+        month_days = 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
+    elif month == 4 or month == 6 or month == 9 or month == 11:
+        month_days = 30
+    else:
+        month_days = 31
+    return day <= month_days
+
+
+# ============================================================================
+# PUBLIC FAST PATHS
+# ============================================================================
+
+cpdef object parse_iso_utc(object date_str):
+    """
+    Parse the DynamoDB "+0000" shape to a timezone-aware UTC datetime.
+
+    Args:
+        date_str: ISO datetime string
+
+    Returns:
+        datetime in UTC, or None if date_str is not that shape
+
+    Raises:
+        ValueError: If a field is out of range (e.g. month 13)
+    """
+    cdef int fields[7]
+    if type(date_str) is not str or not _read_fields(<str>date_str, fields):
+        return None
+    return datetime_new(
+        fields[0], fields[1], fields[2], fields[3], fields[4], fields[5], fields[6], _UTC
+    )
+
+
+cpdef object parse_iso_utc_timestamp(object date_str):
+    """
+    Parse the DynamoDB "+0000" shape to UTC POSIX seconds.
+
+    Same float as parse_iso_utc(date_str).timestamp(): the integer
+    microsecond total is divided once.
+
+    Args:
+        date_str: ISO datetime string
+
+    Returns:
+        Seconds since the Unix epoch, or None if date_str is not that
+        shape or a field is out of range (the caller's fallback raises)
+    """
+    cdef int fields[7]
+    cdef long long microseconds
+    if type(date_str) is not str or not _read_fields(<str>date_str, fields):
+        return None
+    if (not _is_valid_date(fields[0], fields[1], fields[2])
+            or fields[3] > 23 or fields[4] > 59 or fields[5] > 59):
+        return None
+
+    microseconds = (
+        (_days_from_civil(fields[0], fields[1], fields[2]) * 86400
+         + fields[3] * 3600 + fields[4] * 60 + fields[5]) * 1000000
+        + fields[6]
+    )
+    if microseconds > _MAX_EXACT_MICROSECONDS or microseconds < -_MAX_EXACT_MICROSECONDS:
+        return None
+    return <double>microseconds / 1000000.0